@@ -9,9 +9,11 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
+from dataclasses import astuple, fields
+from enum import Enum
 from datetime import datetime
+from bisect import bisect_right
 import time
 import os
 import sys
@@ -21,7 +23,7 @@ try:
     from main__ import (
         CafeLocationOptimizer, UserPreferences, Config,
         GenderTarget, CompetitionLevel, SubwayPreference,
-        PeakTime, WeekdayPreference, PriceRange,
+        PeakTime, WeekdayPreference, PriceRange, DataStore,
         format_korean_number
     )
 except ImportError as e:
@@ -35,16 +37,52 @@ except ImportError as e:
     """)
     st.stop()
 
-# 페이지 설정
-st.set_page_config(
-    page_title="카페 창업 입지 추천 시스템",
-    page_icon="☕",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+# 사이드바 선택지 → Enum 매핑 (선택지 표시 순서와 동일)
+GENDER_MAP = {
+    "상관없음": GenderTarget.ANY,
+    "여성 중심": GenderTarget.FEMALE_CENTERED,
+    "남성 중심": GenderTarget.MALE_CENTERED,
+    "균형": GenderTarget.BALANCED
+}
 
-# 반응형 CSS 스타일
-st.markdown("""
+PRICE_MAP = {
+    "상관없음": PriceRange.ANY,
+    "저가 (~5천원)": PriceRange.LOW,
+    "중저가 (5~8천원)": PriceRange.MID_LOW,
+    "중가 (8~12천원)": PriceRange.MID,
+    "중고가 (12~15천원)": PriceRange.MID_HIGH,
+    "고가 (15천원~)": PriceRange.HIGH
+}
+
+COMPETITION_MAP = {
+    "상관없음": CompetitionLevel.ANY,
+    "블루오션 (카페 ~10개)": CompetitionLevel.BLUE_OCEAN,
+    "적당한 경쟁 (11~30개)": CompetitionLevel.MODERATE,
+    "경쟁 활발 (31~50개)": CompetitionLevel.COMPETITIVE
+}
+
+SUBWAY_MAP = {
+    "상관없음": SubwayPreference.ANY,
+    "필수": SubwayPreference.REQUIRED,
+    "선호": SubwayPreference.PREFERRED
+}
+
+PEAK_TIME_MAP = {
+    "균형": PeakTime.BALANCED,
+    "출근 (06-11시)": PeakTime.MORNING,
+    "점심 (11-14시)": PeakTime.LUNCH,
+    "오후 (14-17시)": PeakTime.AFTERNOON,
+    "저녁 (17-21시)": PeakTime.EVENING
+}
+
+WEEKDAY_MAP = {
+    "균형": WeekdayPreference.BALANCED,
+    "주중 중심": WeekdayPreference.WEEKDAY,
+    "주말 중심": WeekdayPreference.WEEKEND
+}
+
+# 반응형 CSS 스타일 (기본 색상은 .streamlit/config.toml 테마에서 지정)
+APP_CSS = """
 <style>
     /* 반응형 기본 설정 */
     .block-container {
@@ -78,6 +116,29 @@ st.markdown("""
         padding: 0.5rem;
     }
     
+    /* 카드 헤더 (순위 뱃지 + 지역명) */
+    .card-header {
+        display: flex;
+        align-items: center;
+        gap: 1rem;
+    }
+    
+    .card-header h3 {
+        margin: 0;
+        padding: 0;
+    }
+    
+    .card-header p {
+        margin: 0.3rem 0 0 0;
+    }
+    
+    /* 핵심 지표 그리드 */
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 0.8rem;
+    }
+    
     /* 메트릭 카드 - 투명 배경으로 변경 */
     .metric-container {
         background-color: rgba(248, 249, 250, 0.5);
@@ -100,29 +161,6 @@ st.markdown("""
         color: #333;
     }
     
-    /* 탭 패널 스타일 수정 - 박스 제거 */
-    div[data-testid="stTabs"] > div:last-child {
-        background-color: transparent !important;
-        border: none !important;
-        box-shadow: none !important;
-    }
-    
-    /* 탭 컨텐츠 영역 배경 제거 */
-    div[data-testid="stTabsContent"] {
-        background-color: transparent !important;
-    }
-    
-    /* 탭 버튼 스타일 개선 */
-    button[data-baseweb="tab"] {
-        background-color: transparent !important;
-        color: inherit !important;
-    }
-    
-    button[data-baseweb="tab"][aria-selected="true"] {
-        background-color: transparent !important;
-        border-bottom: 2px solid #1976D2 !important;
-    }
-    
     /* 확장 가능한 섹션 */
     .expandable-section {
         background-color: rgba(248, 249, 250, 0.5);
@@ -148,6 +186,10 @@ st.markdown("""
         [data-testid="column"] {
             padding: 0.2rem !important;
         }
+        
+        .metric-grid {
+            grid-template-columns: repeat(2, 1fr);
+        }
     }
     
     /* 태블릿 반응형 */
@@ -238,15 +280,24 @@ st.markdown("""
         color: #E65100 !important;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# 페이지 설정
+st.set_page_config(
+    page_title="카페 창업 입지 추천 시스템",
+    page_icon="☕",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# CSS 주입 (매 실행마다 같은 상수 문자열을 전달)
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # 세션 상태 초기화
-if 'optimizer' not in st.session_state:
-    st.session_state.optimizer = None
+if 'data_loaded' not in st.session_state:
     st.session_state.data_loaded = False
     st.session_state.recommendations = []
     st.session_state.analysis_done = False
-    st.session_state.expanded_cards = set()
 
 # 헤더
 st.markdown('<h1 class="main-header">☕ 카페 창업 입지 추천 시스템</h1>', unsafe_allow_html=True)
@@ -267,8 +318,42 @@ data_paths = {
     'od_folders': ['.', 'seoul_purpose_admdong1_in_202502', 'seoul_purpose_admdong1_in_202503']
 }
 
-# 사이드바 - 필터 설정
-with st.sidebar:
+# 캐시 키로 쓰기 위한 해시 가능한 경로 (리스트 → 튜플)
+data_paths_key = tuple(
+    (name, tuple(path) if isinstance(path, list) else path)
+    for name, path in data_paths.items()
+)
+
+def data_files_mtime(paths_key):
+    """캐시 무효화용 데이터 파일 수정 시각 (폴더/없는 파일은 None)"""
+    files = []
+    for _, path in paths_key:
+        files.extend(path if isinstance(path, tuple) else [path])
+    return tuple(os.path.getmtime(f) if os.path.isfile(f) else None for f in files)
+
+@st.cache_data(persist="disk", show_spinner=False)
+def load_data_store(paths_key, mtimes, store_version):
+    """로드·가공된 데이터 저장소 (디스크에 저장되어 서버 재시작 후에도 재사용)"""
+    optimizer = CafeLocationOptimizer(Config())
+    optimizer.load_data({
+        name: list(path) if isinstance(path, tuple) else path
+        for name, path in paths_key
+    })
+    return optimizer.data_store
+
+@st.cache_resource(show_spinner=False)
+def get_optimizer(paths_key, mtimes):
+    """데이터가 로드된 옵티마이저 (서버 내 모든 세션이 공유)"""
+    optimizer = CafeLocationOptimizer(Config())
+    optimizer.data_store = load_data_store(paths_key, mtimes, DataStore.CACHE_VERSION)
+    return optimizer
+
+def current_optimizer():
+    """현재 데이터 파일 기준 공유 옵티마이저 (세션에 따로 보관하지 않음)"""
+    return get_optimizer(data_paths_key, data_files_mtime(data_paths_key))
+
+# 사이드바 - 필터 설정 (폼으로 묶어 제출 시에만 재실행)
+with st.sidebar.form("filters"):
     st.markdown("## 🔍 분석 조건 설정")
     st.markdown("---")
     
@@ -298,14 +383,13 @@ with st.sidebar:
     st.markdown("### 👥 타겟 고객")
     gender_target = st.selectbox(
         "주요 고객 성별",
-        options=["상관없음", "여성 중심", "남성 중심", "균형"],
+        options=list(GENDER_MAP),
         index=0
     )
     
     price_range = st.selectbox(
         "희망 객단가",
-        options=["상관없음", "저가 (~5천원)", "중저가 (5~8천원)", 
-                "중가 (8~12천원)", "중고가 (12~15천원)", "고가 (15천원~)"],
+        options=list(PRICE_MAP),
         index=0
     )
     
@@ -313,8 +397,7 @@ with st.sidebar:
     st.markdown("### 🏪 경쟁 환경")
     competition = st.selectbox(
         "선호하는 경쟁 환경",
-        options=["상관없음", "블루오션 (카페 ~10개)", 
-                "적당한 경쟁 (11~30개)", "경쟁 활발 (31~50개)"],
+        options=list(COMPETITION_MAP),
         index=0
     )
     
@@ -329,7 +412,7 @@ with st.sidebar:
     st.markdown("### 🚇 입지 조건")
     subway = st.selectbox(
         "지하철 접근성",
-        options=["상관없음", "필수", "선호"],
+        options=list(SUBWAY_MAP),
         index=0
     )
     
@@ -337,38 +420,25 @@ with st.sidebar:
     st.markdown("### ⏰ 운영 조건")
     peak_time = st.selectbox(
         "주력 시간대",
-        options=["균형", "출근 (06-11시)", "점심 (11-14시)", 
-                "오후 (14-17시)", "저녁 (17-21시)"],
+        options=list(PEAK_TIME_MAP),
         index=0
     )
     
     weekday = st.selectbox(
         "주중/주말 선호",
-        options=["균형", "주중 중심", "주말 중심"],
+        options=list(WEEKDAY_MAP),
         index=0
     )
     
     st.markdown("---")
     
     # 분석 버튼
-    analyze_button = st.button("🚀 입지 분석 시작", type="primary", use_container_width=True)
+    analyze_button = st.form_submit_button("🚀 입지 분석 시작", type="primary", use_container_width=True)
 
 # 메인 영역
 def load_data():
-    """데이터 로드 with 재미있는 진행 상황"""
+    """데이터 로드 (로딩 중 카페 관련 팩트 표시)"""
     if not st.session_state.data_loaded:
-        # 로딩 메시지들
-        loading_messages = [
-            "☕ 서울시 카페 데이터를 수집하는 중...",
-            "📊 매출 데이터를 분석하는 중...",
-            "🏪 점포 정보를 정리하는 중...",
-            "🚇 지하철 접근성을 확인하는 중...",
-            "👥 생활인구 데이터를 처리하는 중...",
-            "🗺️ 지역별 특성을 파악하는 중...",
-            "💡 인사이트를 생성하는 중...",
-            "✨ 거의 다 됐어요! 조금만 기다려주세요..."
-        ]
-        
         fun_facts = [
             "💡 알고 계셨나요? 서울에는 약 2만개의 카페가 있습니다!",
             "☕ 한국인의 1인당 연간 커피 소비량은 367잔입니다.",
@@ -380,189 +450,127 @@ def load_data():
             "📍 지하철역 200m 이내 카페가 평균 매출이 30% 높습니다."
         ]
         
-        # 진행 상황 컨테이너
-        progress_container = st.container()
-        with progress_container:
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            fact_text = st.empty()
-            time_text = st.empty()
-            
-            # 애니메이션 효과를 위한 placeholder
-            animation_placeholder = st.empty()
-            
+        # 재미있는 팩트 표시 (로드가 끝나면 제거)
+        fact_text = st.empty()
+        fact_text.info(fun_facts[int(time.time()) % len(fun_facts)])
+        
         try:
-            start_time = time.time()
-            
-            # 단계별 로딩 시뮬레이션
-            total_steps = 100
-            current_step = 0
-            
-            # 옵티마이저 초기화
-            config = Config()
-            st.session_state.optimizer = CafeLocationOptimizer(config)
-            
-            # 각 데이터 로딩 단계
-            data_loading_steps = [
-                ("dong_mapping", "행정동 매핑", 15),
-                ("sales", "매출 데이터", 25),
-                ("stores", "점포 데이터", 20),
-                ("subway", "지하철 데이터", 15),
-                ("population", "생활인구 데이터", 15),
-                ("analysis", "데이터 분석", 10)
-            ]
-            
-            for step_name, step_desc, step_progress in data_loading_steps:
-                # 상태 업데이트
-                message_idx = min(current_step // 13, len(loading_messages) - 1)
-                status_text.markdown(f"### {loading_messages[message_idx]}")
-                
-                # 재미있는 팩트 표시 (3초마다 변경)
-                fact_idx = (int(time.time() - start_time) // 3) % len(fun_facts)
-                fact_text.info(fun_facts[fact_idx])
-                
-                # 경과 시간 표시
-                elapsed = time.time() - start_time
-                time_text.caption(f"⏱️ 경과 시간: {elapsed:.0f}초")
-                
-                # 애니메이션 (로딩 스피너)
-                if int(elapsed) % 2 == 0:
-                    animation_placeholder.markdown("🔄 처리 중...")
-                else:
-                    animation_placeholder.markdown("⚡ 처리 중...")
-                
-                # 실제 데이터 로딩 (시뮬레이션)
-                for i in range(step_progress):
-                    current_step += 1
-                    progress_bar.progress(current_step / total_steps)
-                    time.sleep(0.05)  # 실제로는 데이터 로딩 시간
-            
-            # 데이터 로드
-            st.session_state.optimizer.load_data(data_paths)
+            # 데이터 로드 (캐시된 옵티마이저 공유)
+            with st.spinner("☕ 서울시 카페 데이터를 불러오는 중..."):
+                current_optimizer()
             
-            # 완료
-            progress_bar.progress(1.0)
-            status_text.success("✅ 데이터 로드 완료!")
+            # 완료 (재실행 없이 이어서 결과 화면 표시)
             fact_text.empty()
-            time_text.empty()
-            animation_placeholder.empty()
             
             # 축하 메시지
+            st.toast("✅ 데이터 로드 완료!")
             st.balloons()
-            time.sleep(1)
             
             st.session_state.data_loaded = True
-            st.rerun()
             
         except Exception as e:
             st.error(f"❌ 데이터 로드 실패: {str(e)}")
             st.stop()
 
+# 통화 포맷 구간 (경계값 이상이면 다음 단위 사용)
+CURRENCY_THRESHOLDS = (10000, 10000000, 100000000)
+CURRENCY_FORMATTERS = (
+    lambda v: f"{v:,.0f}원",
+    lambda v: f"{v/10000:.0f}만원",  # 1만원 이상
+    lambda v: f"{v/10000000:.1f}천만원",  # 1천만원 이상
+    lambda v: f"{v/100000000:.1f}억원"  # 1억 이상
+)
+
+def format_currency(value):
+    """금액 포맷팅 (구간 표를 이분 탐색)"""
+    return CURRENCY_FORMATTERS[bisect_right(CURRENCY_THRESHOLDS, value)](value)
+
+def format_count(value):
+    """개수 포맷팅"""
+    return f"{int(value):,}개"
+
+def format_percent(value):
+    """비율 포맷팅"""
+    return f"{value:.1f}%"
+
+def format_price(value):
+    """객단가 포맷팅"""
+    return f"{int(value):,}원"
+
 def format_number_for_display(value, type="currency"):
     """숫자를 사용자 친화적으로 포맷팅"""
     if type == "currency":
-        if value >= 100000000:  # 1억 이상
-            return f"{value/100000000:.1f}억원"
-        elif value >= 10000000:  # 1천만원 이상
-            return f"{value/10000000:.1f}천만원"
-        elif value >= 10000:  # 1만원 이상
-            return f"{value/10000:.0f}만원"
-        else:
-            return f"{value:,.0f}원"
+        return format_currency(value)
     elif type == "count":
-        return f"{int(value):,}개"
+        return format_count(value)
     elif type == "percent":
-        return f"{value:.1f}%"
+        return format_percent(value)
     elif type == "price":
-        return f"{int(value):,}원"
+        return format_price(value)
     else:
         return f"{value:,.0f}"
 
-def create_user_preferences():
-    """사용자 설정을 UserPreferences 객체로 변환"""
+def format_currency_array(values):
+    """format_currency의 벡터화 버전"""
+    values = np.asarray(values, dtype=np.float64)
+    return np.select(
+        [values >= 100000000, values >= 10000000, values >= 10000],
+        [np.char.mod("%.1f억원", values / 100000000),
+         np.char.mod("%.1f천만원", values / 10000000),
+         np.char.mod("%.0f만원", values / 10000)],
+        default=np.array([f"{v:,.0f}원" for v in values])
+    )
+
+def create_user_preferences(min_revenue, max_revenue, gender_target, price_range,
+                            competition, min_stores, subway, peak_time, weekday):
+    """사이드바 선택값을 UserPreferences 객체로 변환"""
     preferences = UserPreferences()
     
     # 매출 범위
     preferences.min_revenue = min_revenue
     preferences.max_revenue = max_revenue
     
-    # 성별 타겟
-    gender_map = {
-        "여성 중심": GenderTarget.FEMALE_CENTERED,
-        "남성 중심": GenderTarget.MALE_CENTERED,
-        "균형": GenderTarget.BALANCED,
-        "상관없음": GenderTarget.ANY
-    }
-    preferences.gender_target = gender_map.get(gender_target, GenderTarget.ANY)
-    
-    # 경쟁 환경
-    comp_map = {
-        "블루오션 (카페 ~10개)": CompetitionLevel.BLUE_OCEAN,
-        "적당한 경쟁 (11~30개)": CompetitionLevel.MODERATE,
-        "경쟁 활발 (31~50개)": CompetitionLevel.COMPETITIVE,
-        "상관없음": CompetitionLevel.ANY
-    }
-    preferences.competition = comp_map.get(competition, CompetitionLevel.ANY)
-    
-    # 지하철
-    subway_map = {
-        "필수": SubwayPreference.REQUIRED,
-        "선호": SubwayPreference.PREFERRED,
-        "상관없음": SubwayPreference.ANY
-    }
-    preferences.subway = subway_map.get(subway, SubwayPreference.ANY)
-    
-    # 시간대
-    time_map = {
-        "출근 (06-11시)": PeakTime.MORNING,
-        "점심 (11-14시)": PeakTime.LUNCH,
-        "오후 (14-17시)": PeakTime.AFTERNOON,
-        "저녁 (17-21시)": PeakTime.EVENING,
-        "균형": PeakTime.BALANCED
-    }
-    preferences.peak_time = time_map.get(peak_time, PeakTime.BALANCED)
-    
-    # 주중/주말
-    weekday_map = {
-        "주중 중심": WeekdayPreference.WEEKDAY,
-        "주말 중심": WeekdayPreference.WEEKEND,
-        "균형": WeekdayPreference.BALANCED
-    }
-    preferences.weekday_preference = weekday_map.get(weekday, WeekdayPreference.BALANCED)
-    
-    # 객단가
-    price_map = {
-        "저가 (~5천원)": PriceRange.LOW,
-        "중저가 (5~8천원)": PriceRange.MID_LOW,
-        "중가 (8~12천원)": PriceRange.MID,
-        "중고가 (12~15천원)": PriceRange.MID_HIGH,
-        "고가 (15천원~)": PriceRange.HIGH,
-        "상관없음": PriceRange.ANY
-    }
-    preferences.price_range = price_map.get(price_range, PriceRange.ANY)
+    # 선택지 → Enum (모듈 상수 매핑 사용)
+    preferences.gender_target = GENDER_MAP.get(gender_target, GenderTarget.ANY)
+    preferences.competition = COMPETITION_MAP.get(competition, CompetitionLevel.ANY)
+    preferences.subway = SUBWAY_MAP.get(subway, SubwayPreference.ANY)
+    preferences.peak_time = PEAK_TIME_MAP.get(peak_time, PeakTime.BALANCED)
+    preferences.weekday_preference = WEEKDAY_MAP.get(weekday, WeekdayPreference.BALANCED)
+    preferences.price_range = PRICE_MAP.get(price_range, PriceRange.ANY)
     
     # 최소 점포수
     preferences.min_stores = min_stores
     
     return preferences
 
-def run_analysis():
+def preferences_key(preferences):
+    """캐시 키용 선호 조건 튜플 (Enum → 값, 스칼라만 포함)"""
+    return tuple(
+        value.value if isinstance(value, Enum) else value
+        for value in astuple(preferences)
+    )
+
+def preferences_from_key(prefs_key):
+    """캐시 키 튜플 → UserPreferences"""
+    return UserPreferences(*(
+        type(f.default)(value) if isinstance(f.default, Enum) else value
+        for f, value in zip(fields(UserPreferences), prefs_key)
+    ))
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def recommend_cached(_optimizer, optimizer_id, prefs_key, top_n):
+    """선호 조건별 추천 결과 캐시 (_optimizer는 해싱하지 않고 id로만 구분)"""
+    return _optimizer.recommend_locations(preferences_from_key(prefs_key), top_n=top_n)
+
+def run_analysis(preferences):
     """분석 실행"""
     with st.spinner("🔍 최적 입지를 분석하는 중..."):
-        progress_bar = st.progress(0)
-        
-        # 사용자 설정
-        preferences = create_user_preferences()
-        progress_bar.progress(30)
-        
-        # 분석 실행
-        recommendations = st.session_state.optimizer.recommend_locations(preferences, top_n=5)
-        progress_bar.progress(90)
+        # 분석 실행 (옵티마이저가 다시 로드되면 id가 바뀌어 캐시도 무효화)
+        optimizer = current_optimizer()
+        recommendations = recommend_cached(optimizer, id(optimizer), preferences_key(preferences), 5)
         
         st.session_state.recommendations = recommendations
         st.session_state.analysis_done = True
-        st.session_state.expanded_cards = set()  # 확장된 카드 초기화
-        progress_bar.progress(100)
         
         if recommendations:
             st.success(f"✅ 분석 완료! {len(recommendations)}개의 추천 지역을 찾았습니다.")
@@ -578,105 +586,128 @@ def get_competition_level(store_count):
     else:
         return "🔴 경쟁 활발", "danger"
 
+@st.fragment
 def display_results():
-    """결과 표시"""
+    """결과 표시 (탭 전환 등 결과 영역 위젯은 이 영역만 다시 실행)"""
     if not st.session_state.recommendations:
         st.info("📍 좌측에서 조건을 설정하고 '입지 분석 시작' 버튼을 클릭하세요.")
         return
     
-    # 탭 생성
-    tab1, tab2, tab3 = st.tabs(["📊 추천 결과", "📈 비교 분석", "💡 인사이트"])
+    # 탭 선택 (선택된 탭만 렌더링)
+    active_tab = st.radio(
+        "보기",
+        options=["📊 추천 결과", "📈 비교 분석", "💡 인사이트"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_tab"
+    )
     
-    with tab1:
+    if active_tab == "📊 추천 결과":
         display_recommendations_with_details()
-    
-    with tab2:
+    elif active_tab == "📈 비교 분석":
         display_comparison()
-    
-    with tab3:
+    else:
         display_insights()
 
 def display_recommendations_with_details():
     """추천 결과와 상세 분석 통합 표시"""
     st.markdown("## 🏆 카페 창업 추천 입지 TOP 5")
     
-    for i, rec in enumerate(st.session_state.recommendations):
-        rank = i + 1
-        card_key = f"card_{rank}"
+    recommendations = st.session_state.recommendations
+    
+    # 간단히 보기: 카드 대신 표 하나로 표시
+    if st.toggle("📋 간단히 보기", key="compact_view"):
+        display_recommendations_table(recommendations)
+        return
+    
+    for i, rec in enumerate(recommendations):
+        display_recommendation_card(rec, i + 1)
         
-        # 순위별 색상
-        rank_colors = {1: "#4CAF50", 2: "#2196F3", 3: "#FF9800", 4: "#9E9E9E", 5: "#757575"}
-        rank_color = rank_colors.get(rank, "#757575")
+        # 카드 간 구분선
+        if i < len(recommendations) - 1:
+            st.markdown("<br>", unsafe_allow_html=True)
+
+def display_recommendations_table(recommendations):
+    """추천 결과 요약 표 (st.dataframe 한 번으로 렌더링)"""
+    df = build_comparison_df(comparison_key(recommendations))
+    
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        column_order=["순위", "지역", "종합 점수", "월평균 매출", "카페 수", "폐업률", "여성 비율", "객단가"],
+        column_config={
+            "순위": st.column_config.NumberColumn("순위", format="#%d", width="small"),
+            "지역": st.column_config.TextColumn("지역", width="medium"),
+            "종합 점수": st.column_config.NumberColumn("종합 점수", format="%.1f점"),
+            "월평균 매출": st.column_config.ProgressColumn(
+                "월평균 매출", format="%.0f만원", min_value=0, max_value=float(df["월평균 매출"].max())
+            ),
+            "카페 수": st.column_config.NumberColumn("카페 수", format="%d개"),
+            "폐업률": st.column_config.NumberColumn("폐업률", format="%.1f%%"),
+            "여성 비율": st.column_config.NumberColumn("여성 비율", format="%.0f%%"),
+            "객단가": st.column_config.NumberColumn("객단가", format="%d원"),
+        }
+    )
+
+def display_recommendation_card(rec, rank):
+    """추천 카드 표시"""
+    # 순위별 색상
+    rank_colors = {1: "#4CAF50", 2: "#2196F3", 3: "#FF9800", 4: "#9E9E9E", 5: "#757575"}
+    rank_color = rank_colors.get(rank, "#757575")
+    
+    # 추천 카드 컨테이너 (흰색 배경 제거)
+    with st.container():
+        # 기본 정보 (순위 뱃지와 지역명은 한 번에 렌더링)
+        st.markdown(f"""
+        <div class="card-header">
+            <div class="rank-badge" style="color: {rank_color};">#{rank}</div>
+            <div>
+                <h3>{rec.dong_name}</h3>
+                <p><b>{rec.gu_name}</b> | 종합 점수: ⭐ {rec.score:.2f}</p>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
         
-        # 추천 카드 컨테이너 (흰색 배경 제거)
-        with st.container():
-            # 기본 정보 행
-            col1, col2, col3 = st.columns([1, 4, 2])
-            
-            with col1:
-                st.markdown(f"""
-                <div class="rank-badge" style="color: {rank_color};">
-                    #{rank}
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"### {rec.dong_name}")
-                st.markdown(f"**{rec.gu_name}** | 종합 점수: ⭐ {rec.score:.2f}")
-            
-            with col3:
-                # 상세보기 토글 버튼
-                if st.button(
-                    "📊 상세 분석 보기" if card_key not in st.session_state.expanded_cards else "📉 상세 분석 닫기",
-                    key=f"toggle_{rank}",
-                    use_container_width=True
-                ):
-                    if card_key in st.session_state.expanded_cards:
-                        st.session_state.expanded_cards.remove(card_key)
-                    else:
-                        st.session_state.expanded_cards.add(card_key)
-                    st.rerun()
-            
-            # 핵심 지표 (항상 표시)
-            st.markdown("---")
-            
-            # 반응형 컬럼 설정
-            if st.session_state.get('screen_width', 1200) < 768:
-                # 모바일: 2x2 그리드
-                metrics_cols = 2
-            else:
-                # 데스크톱/태블릿: 4x1 그리드
-                metrics_cols = 4
-            
-            cols = st.columns(metrics_cols)
-            
-            metrics = [
-                ("💰 월매출", format_number_for_display(rec.avg_revenue_per_store, "currency")),
-                ("🏪 카페", f"{rec.store_count}개"),
-                ("📉 폐업률", f"{rec.closure_rate*100:.1f}%"),
-                ("🚇 지하철", "있음" if rec.subway_access else "없음")
-            ]
-            
-            for idx, (label, value) in enumerate(metrics):
-                with cols[idx % metrics_cols]:
-                    st.markdown(f"""
-                    <div class="metric-container">
-                        <div class="metric-label">{label}</div>
-                        <div class="metric-value">{value}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            # 상세 분석 섹션 (확장 시에만 표시)
-            if card_key in st.session_state.expanded_cards:
-                st.markdown("---")
-                display_detailed_analysis(rec, rank)
-            
-            # 카드 간 구분선
-            if i < len(st.session_state.recommendations) - 1:
-                st.markdown("<br>", unsafe_allow_html=True)
+        # 핵심 지표 (항상 표시, 모바일에서는 CSS로 2x2 그리드)
+        metrics = [
+            ("💰 월매출", format_currency(rec.avg_revenue_per_store)),
+            ("🏪 카페", f"{rec.store_count}개"),
+            ("📉 폐업률", f"{rec.closure_rate*100:.1f}%"),
+            ("🚇 지하철", "있음" if rec.subway_access else "없음")
+        ]
+        
+        tiles = "".join(
+            f'<div class="metric-container"><div class="metric-label">{label}</div>'
+            f'<div class="metric-value">{value}</div></div>'
+            for label, value in metrics
+        )
+        st.markdown(f'<hr><div class="metric-grid">{tiles}</div>', unsafe_allow_html=True)
+        
+        # 상세 분석 섹션 (펼치기/접기는 브라우저에서 처리되어 재실행 없음)
+        with st.expander("📊 상세 분석 보기", expanded=False):
+            display_detailed_analysis(rec)
+
+DETAIL_CHART_TEMPLATE = "plotly+cafe_detail"
+
+def register_chart_templates():
+    """상세 분석 차트 공통 레이아웃 템플릿 등록"""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    
+    if "cafe_detail" not in pio.templates:
+        pio.templates["cafe_detail"] = go.layout.Template(
+            layout=dict(margin=dict(l=0, r=0, t=40, b=0), showlegend=False)
+        )
 
-def display_detailed_analysis(rec, rank):
+def display_detailed_analysis(rec):
     """개별 지역 상세 분석"""
+    # Plotly는 무거워 실제로 차트를 그릴 때만 import
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    register_chart_templates()
+    
     # 상세 분석 컨테이너
     st.markdown('<div class="detail-section">', unsafe_allow_html=True)
     
@@ -690,15 +721,18 @@ def display_detailed_analysis(rec, rank):
         revenue_data = {
             "구분": ["전체 매출", "점포당 매출", "일 평균", "객단가"],
             "금액": [
-                format_number_for_display(rec.total_revenue, "currency"),
-                format_number_for_display(rec.avg_revenue_per_store, "currency"),
-                format_number_for_display(rec.avg_revenue_per_store / 30, "currency"),
-                format_number_for_display(rec.avg_price, "price")
+                format_currency(rec.total_revenue),
+                format_currency(rec.avg_revenue_per_store),
+                format_currency(rec.avg_revenue_per_store / 30),
+                format_price(rec.avg_price)
             ]
         }
         
-        for idx, row in enumerate(revenue_data["구분"]):
-            st.markdown(f"**{row}**: {revenue_data['금액'][idx]}")
+        # 항목별 호출 대신 한 번에 렌더링
+        st.markdown("\n\n".join(
+            f"**{label}**: {amount}"
+            for label, amount in zip(revenue_data["구분"], revenue_data["금액"])
+        ))
     
     with col2:
         # 매출 구성 차트
@@ -715,10 +749,9 @@ def display_detailed_analysis(rec, rank):
             title="성별 매출 비율",
             yaxis_title="비율 (%)",
             height=250,
-            showlegend=False,
-            margin=dict(l=0, r=0, t=40, b=0)
+            template=DETAIL_CHART_TEMPLATE
         )
-        st.plotly_chart(fig_revenue, use_container_width=True, key=f"gender_{rank}")
+        st.plotly_chart(fig_revenue, use_container_width=True, key=f"gender_{rec.dong_code}")
     
     # 2. 시간대별 분석
     st.markdown("#### ⏰ 시간대별 매출 패턴")
@@ -740,9 +773,9 @@ def display_detailed_analysis(rec, rank):
     fig_time.update_layout(
         yaxis_title="매출 비율 (%)",
         height=300,
-        margin=dict(l=0, r=0, t=40, b=0)
+        template=DETAIL_CHART_TEMPLATE
     )
-    st.plotly_chart(fig_time, use_container_width=True, key=f"time_{rank}")
+    st.plotly_chart(fig_time, use_container_width=True, key=f"time_{rec.dong_code}")
     
     # 3. 경쟁 환경 분석
     col1, col2 = st.columns(2)
@@ -779,218 +812,231 @@ def display_detailed_analysis(rec, rank):
         ])
         fig_weekday.update_layout(
             height=250,
-            margin=dict(l=0, r=0, t=20, b=0),
+            template=DETAIL_CHART_TEMPLATE,
+            margin_t=20,
             showlegend=True
         )
-        st.plotly_chart(fig_weekday, use_container_width=True, key=f"weekday_{rank}")
+        st.plotly_chart(fig_weekday, use_container_width=True, key=f"weekday_{rec.dong_code}")
     
     # 4. 지역 특성 인사이트
     st.markdown("#### 💡 이 지역의 특징")
     
     # 인사이트 생성
-    insights = generate_location_insights(rec)
+    icons, texts, box_classes = generate_location_insights(rec)
     
-    for insight in insights:
-        box_class = insight.get('type', 'info') + '-box'
-        st.markdown(f"""
-        <div class="insight-box {box_class}">
-            {insight['icon']} {insight['text']}
-        </div>
-        """, unsafe_allow_html=True)
+    if icons:
+        st.markdown("\n".join(
+            f'<div class="insight-box {box_class}">{icon} {text}</div>'
+            for icon, text, box_class in zip(icons, texts, box_classes)
+        ), unsafe_allow_html=True)
     
     st.markdown('</div>', unsafe_allow_html=True)
 
 def generate_location_insights(rec):
-    """지역별 맞춤 인사이트 생성"""
-    insights = []
+    """지역별 맞춤 인사이트 생성 (인사이트에 쓰이는 값 기준으로 캐시)"""
+    return location_insights_cached(
+        rec.avg_revenue_per_store, rec.female_ratio, rec.store_count, rec.closure_rate,
+        rec.subway_access, rec.morning_sales_ratio, rec.weekday_ratio
+    )
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def location_insights_cached(avg_revenue_per_store, female_ratio, store_count, closure_rate,
+                             subway_access, morning_sales_ratio, weekday_ratio):
+    """지역별 맞춤 인사이트 생성 (순수 함수, 아이콘/문구/박스 클래스 병렬 리스트)"""
+    icons = []
+    texts = []
+    box_classes = []
     
     # 매출 인사이트
-    if rec.avg_revenue_per_store >= 30000 * 10000:  # 3억원 이상
-        insights.append({
-            'icon': '🚀',
-            'text': f'이 지역은 <b>{format_number_for_display(rec.avg_revenue_per_store, "currency")}</b>의 높은 매출을 기록하는 프리미엄 상권입니다.',
-            'type': 'success'
-        })
-    elif rec.avg_revenue_per_store < 10000 * 10000:  # 1억원 미만
-        insights.append({
-            'icon': '💡',
-            'text': f'월 매출이 <b>{format_number_for_display(rec.avg_revenue_per_store, "currency")}</b>로 상대적으로 낮습니다. 원가 관리가 중요합니다.',
-            'type': 'warning'
-        })
+    if avg_revenue_per_store >= 30000 * 10000:  # 3억원 이상
+        icons.append('🚀')
+        texts.append(f'이 지역은 <b>{format_currency(avg_revenue_per_store)}</b>의 높은 매출을 기록하는 프리미엄 상권입니다.')
+        box_classes.append('success-box')
+    elif avg_revenue_per_store < 10000 * 10000:  # 1억원 미만
+        icons.append('💡')
+        texts.append(f'월 매출이 <b>{format_currency(avg_revenue_per_store)}</b>로 상대적으로 낮습니다. 원가 관리가 중요합니다.')
+        box_classes.append('warning-box')
     
     # 여성 고객 인사이트
-    if rec.female_ratio > 0.6:
-        insights.append({
-            'icon': '👩',
-            'text': f'여성 고객 비율이 {rec.female_ratio*100:.0f}%로 높습니다. 디저트 카페나 브런치 콘셉트를 고려해보세요.',
-            'type': 'info'
-        })
+    if female_ratio > 0.6:
+        icons.append('👩')
+        texts.append(f'여성 고객 비율이 {female_ratio*100:.0f}%로 높습니다. 디저트 카페나 브런치 콘셉트를 고려해보세요.')
+        box_classes.append('info-box')
     
     # 경쟁 인사이트
-    if rec.store_count < 10:
-        insights.append({
-            'icon': '🌊',
-            'text': '카페 점포수가 적어 선점 효과를 기대할 수 있습니다. 단, 수요 검증이 필요합니다.',
-            'type': 'info'
-        })
-    elif rec.store_count > 30:
-        insights.append({
-            'icon': '⚔️',
-            'text': '경쟁이 치열한 지역입니다. 명확한 차별화 전략과 충성 고객 확보가 필수입니다.',
-            'type': 'warning'
-        })
+    if store_count < 10:
+        icons.append('🌊')
+        texts.append('카페 점포수가 적어 선점 효과를 기대할 수 있습니다. 단, 수요 검증이 필요합니다.')
+        box_classes.append('info-box')
+    elif store_count > 30:
+        icons.append('⚔️')
+        texts.append('경쟁이 치열한 지역입니다. 명확한 차별화 전략과 충성 고객 확보가 필수입니다.')
+        box_classes.append('warning-box')
     
     # 폐업률 인사이트
-    if rec.closure_rate < 0.1:
-        insights.append({
-            'icon': '🛡️',
-            'text': f'폐업률이 {rec.closure_rate*100:.1f}%로 매우 낮아 안정적인 상권입니다.',
-            'type': 'success'
-        })
-    elif rec.closure_rate > 0.2:
-        insights.append({
-            'icon': '⚠️',
-            'text': f'폐업률이 {rec.closure_rate*100:.1f}%로 높은 편입니다. 신중한 사업 계획이 필요합니다.',
-            'type': 'warning'
-        })
+    if closure_rate < 0.1:
+        icons.append('🛡️')
+        texts.append(f'폐업률이 {closure_rate*100:.1f}%로 매우 낮아 안정적인 상권입니다.')
+        box_classes.append('success-box')
+    elif closure_rate > 0.2:
+        icons.append('⚠️')
+        texts.append(f'폐업률이 {closure_rate*100:.1f}%로 높은 편입니다. 신중한 사업 계획이 필요합니다.')
+        box_classes.append('warning-box')
     
     # 지하철 인사이트
-    if rec.subway_access:
-        insights.append({
-            'icon': '🚇',
-            'text': '지하철역과 가까워 유동인구가 많습니다. 테이크아웃 전문점도 고려해보세요.',
-            'type': 'info'
-        })
+    if subway_access:
+        icons.append('🚇')
+        texts.append('지하철역과 가까워 유동인구가 많습니다. 테이크아웃 전문점도 고려해보세요.')
+        box_classes.append('info-box')
     
     # 시간대 인사이트
-    if rec.morning_sales_ratio > 0.3:
-        insights.append({
-            'icon': '🌅',
-            'text': '아침 시간대 매출이 높습니다. 출근길 고객을 위한 빠른 서비스가 중요합니다.',
-            'type': 'info'
-        })
+    if morning_sales_ratio > 0.3:
+        icons.append('🌅')
+        texts.append('아침 시간대 매출이 높습니다. 출근길 고객을 위한 빠른 서비스가 중요합니다.')
+        box_classes.append('info-box')
     
     # 주중/주말 인사이트
-    if rec.weekday_ratio > 0.7:
-        insights.append({
-            'icon': '💼',
-            'text': '주중 매출 비중이 높은 직장인 상권입니다. 업무 미팅 공간 제공을 고려하세요.',
-            'type': 'info'
-        })
-    elif rec.weekday_ratio < 0.5:
-        insights.append({
-            'icon': '🎉',
-            'text': '주말 매출 비중이 높습니다. 가족 단위 고객을 위한 공간 구성이 유리합니다.',
-            'type': 'info'
-        })
-    
-    return insights
+    if weekday_ratio > 0.7:
+        icons.append('💼')
+        texts.append('주중 매출 비중이 높은 직장인 상권입니다. 업무 미팅 공간 제공을 고려하세요.')
+        box_classes.append('info-box')
+    elif weekday_ratio < 0.5:
+        icons.append('🎉')
+        texts.append('주말 매출 비중이 높습니다. 가족 단위 고객을 위한 공간 구성이 유리합니다.')
+        box_classes.append('info-box')
+    
+    return icons, texts, box_classes
 
-def display_comparison():
-    """비교 분석 표시"""
-    if not st.session_state.recommendations:
-        return
-    
-    st.markdown("## 📊 추천 지역 비교 분석")
-    
-    # 데이터 준비
-    df_data = []
-    for i, rec in enumerate(st.session_state.recommendations):
-        df_data.append({
-            '지역': f"{rec.dong_name}",
-            '순위': i + 1,
-            '월평균 매출': rec.avg_revenue_per_store / 10000,  # 만원 단위
-            '카페 수': rec.store_count,
-            '폐업률': rec.closure_rate * 100,
-            '여성 비율': rec.female_ratio * 100,
-            '객단가': rec.avg_price,
-            '종합 점수': rec.score * 100
-        })
-    
-    df = pd.DataFrame(df_data)
-    
-    # 반응형 레이아웃
-    col1, col2 = st.columns([1, 1])
-    
-    with col1:
-        # 매출 비교 차트
-        fig1 = px.bar(
-            df, 
-            x='지역', 
-            y='월평균 매출',
-            title='월평균 매출 비교 (만원)',
-            color='월평균 매출',
-            color_continuous_scale='Blues',
-            text='월평균 매출'
-        )
-        fig1.update_traces(texttemplate='%{text:,.0f}', textposition='outside')
-        fig1.update_layout(
-            showlegend=False,
-            height=400,
-            xaxis_tickangle=-45
-        )
-        st.plotly_chart(fig1, use_container_width=True)
-    
-    with col2:
-        # 경쟁 vs 매출 산점도
-        fig2 = px.scatter(
-            df, 
-            x='카페 수', 
-            y='월평균 매출',
-            size='종합 점수',
-            color='지역',
-            title='경쟁 환경 vs 매출',
-            hover_data={
-                '객단가': ':,',
-                '폐업률': ':.1f',
-                '카페 수': ':,',
-                '월평균 매출': ':,.0f',
-                '종합 점수': ':.1f'
-            },
-            labels={
-                '카페 수': '카페 수 (개)',
-                '월평균 매출': '월평균 매출 (만원)',
-                '객단가': '객단가 (원)',
-                '폐업률': '폐업률 (%)',
-                '종합 점수': '점수'
-            }
-        )
-        fig2.update_layout(height=400)
-        st.plotly_chart(fig2, use_container_width=True)
+def comparison_key(recommendations):
+    """비교 분석 캐시 키 (추천 결과 중 비교에 쓰이는 값만 튜플로)"""
+    return tuple(
+        (rec.dong_name, rec.avg_revenue_per_store, rec.store_count, rec.closure_rate,
+         rec.female_ratio, rec.avg_price, rec.score, rec.subway_access)
+        for rec in recommendations
+    )
+
+@st.cache_data(show_spinner=False)
+def build_comparison_df(recs_key):
+    """비교 분석용 데이터프레임 생성 (컬럼 단위로 구성)"""
+    (dong_names, avg_revenues, store_counts, closure_rates,
+     female_ratios, avg_prices, scores, _) = zip(*recs_key)
+    
+    df_data = {
+        '지역': list(dong_names),
+        '순위': np.arange(1, len(recs_key) + 1),
+        '월평균 매출': np.array(avg_revenues, dtype=np.float64) / 10000,  # 만원 단위
+        '카페 수': np.array(store_counts),
+        '폐업률': np.array(closure_rates, dtype=np.float64) * 100,
+        '여성 비율': np.array(female_ratios, dtype=np.float64) * 100,
+        '객단가': np.array(avg_prices, dtype=np.float64),
+        '종합 점수': np.array(scores, dtype=np.float64) * 100
+    }
     
-    # 종합 비교 레이더 차트
-    st.markdown("### 🎯 상위 3개 지역 종합 비교")
+    # 차트 JSON 크기를 줄이기 위해 수치 컬럼 축소
+    return pd.DataFrame(df_data).astype({
+        '순위': 'int8',
+        '월평균 매출': 'float32',
+        '카페 수': 'int32',
+        '폐업률': 'float32',
+        '여성 비율': 'float32',
+        '객단가': 'float32',
+        '종합 점수': 'float32'
+    })
+
+@st.cache_data(show_spinner=False)
+def build_revenue_chart(recs_key):
+    """월평균 매출 비교 막대 차트"""
+    import plotly.express as px
+    
+    df = build_comparison_df(recs_key)
+    
+    fig = px.bar(
+        df, 
+        x='지역', 
+        y='월평균 매출',
+        title='월평균 매출 비교 (만원)',
+        color='월평균 매출',
+        color_continuous_scale='Blues',
+        text='월평균 매출'
+    )
+    fig.update_traces(texttemplate='%{text:,.0f}', textposition='outside')
+    fig.update_layout(
+        showlegend=False,
+        height=400,
+        xaxis_tickangle=-45
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_competition_chart(recs_key):
+    """경쟁 환경 vs 매출 산점도"""
+    import plotly.express as px
+    
+    df = build_comparison_df(recs_key)
+    
+    fig = px.scatter(
+        df, 
+        x='카페 수', 
+        y='월평균 매출',
+        size='종합 점수',
+        color='지역',
+        title='경쟁 환경 vs 매출',
+        render_mode='webgl',
+        hover_data={
+            '객단가': ':,',
+            '폐업률': ':.1f',
+            '카페 수': ':,',
+            '월평균 매출': ':,.0f',
+            '종합 점수': ':.1f'
+        },
+        labels={
+            '카페 수': '카페 수 (개)',
+            '월평균 매출': '월평균 매출 (만원)',
+            '객단가': '객단가 (원)',
+            '폐업률': '폐업률 (%)',
+            '종합 점수': '점수'
+        }
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_radar_chart(recs_key):
+    """상위 3개 지역 종합 비교 레이더 차트"""
+    import plotly.graph_objects as go
     
     categories = ['매출력', '안정성', '경쟁우위', '고객매력', '접근성']
     
-    fig3 = go.Figure()
+    fig = go.Figure()
     
     colors = ['#1976D2', '#FF6B6B', '#4ECDC4']
     
-    # 최대값 찾기 (정규화용)
-    max_revenue = max(r.avg_revenue_per_store for r in st.session_state.recommendations[:3])
-    
-    for i, rec in enumerate(st.session_state.recommendations[:3]):
-        # 각 지표 정규화 (0-100)
-        values = [
-            (rec.avg_revenue_per_store / max_revenue) * 100,  # 매출력 (상대 비교)
-            (1 - rec.closure_rate) * 100,  # 안정성
-            max(100 - (rec.store_count / 50 * 100), 0),  # 경쟁우위
-            rec.female_ratio * 100,  # 고객매력 (여성비율 기준)
-            100 if rec.subway_access else 50  # 접근성
-        ]
-        
-        fig3.add_trace(go.Scatterpolar(
-            r=values,
+    top3 = recs_key[:3]
+    dong_names, avg_revenues, store_counts, closure_rates, female_ratios, _, _, subway_access = (
+        np.array(column) for column in zip(*top3)
+    )
+    
+    # 각 지표 정규화 (0-100), 행 = 지역
+    values = np.column_stack([
+        avg_revenues / avg_revenues.max() * 100,  # 매출력 (상대 비교)
+        (1 - closure_rates) * 100,  # 안정성
+        np.maximum(100 - store_counts / 50 * 100, 0),  # 경쟁우위
+        female_ratios * 100,  # 고객매력 (여성비율 기준)
+        np.where(subway_access, 100, 50)  # 접근성
+    ])
+    
+    for i, dong_name in enumerate(dong_names):
+        fig.add_trace(go.Scatterpolar(
+            r=values[i],
             theta=categories,
             fill='toself',
-            name=rec.dong_name,
+            name=dong_name,
             line_color=colors[i],
             fillcolor=colors[i],
             opacity=0.6
         ))
     
-    fig3.update_layout(
+    fig.update_layout(
         polar=dict(
             radialaxis=dict(
                 visible=True,
@@ -1004,22 +1050,48 @@ def display_comparison():
         height=500,
         title="다차원 경쟁력 분석"
     )
+    return fig
+
+def display_comparison():
+    """비교 분석 표시"""
+    if not st.session_state.recommendations:
+        return
     
-    st.plotly_chart(fig3, use_container_width=True)
+    st.markdown("## 📊 추천 지역 비교 분석")
+    
+    # 데이터 준비 (추천 결과가 바뀔 때만 다시 생성)
+    recs_key = comparison_key(st.session_state.recommendations)
+    df = build_comparison_df(recs_key)
+    
+    # 반응형 레이아웃
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        # 매출 비교 차트
+        st.plotly_chart(build_revenue_chart(recs_key), use_container_width=True)
+    
+    with col2:
+        # 경쟁 vs 매출 산점도
+        st.plotly_chart(build_competition_chart(recs_key), use_container_width=True)
+    
+    # 종합 비교 레이더 차트
+    st.markdown("### 🎯 상위 3개 지역 종합 비교")
+    
+    st.plotly_chart(build_radar_chart(recs_key), use_container_width=True)
     
     # 상세 비교 테이블
     st.markdown("### 📋 상세 수치 비교")
     
-    # 테이블 데이터 포맷팅
-    comparison_df = df.copy()
-    comparison_df['월평균 매출'] = comparison_df['월평균 매출'].apply(lambda x: format_number_for_display(x*10000, "currency"))
-    comparison_df['폐업률'] = comparison_df['폐업률'].apply(lambda x: f"{x:.1f}%")
-    comparison_df['여성 비율'] = comparison_df['여성 비율'].apply(lambda x: f"{x:.0f}%")
-    comparison_df['객단가'] = comparison_df['객단가'].apply(lambda x: format_number_for_display(x, "price"))
-    comparison_df['종합 점수'] = comparison_df['종합 점수'].apply(lambda x: f"{x:.1f}점")
-    
-    # 순위 열 제거 (이미 정렬되어 있음)
-    comparison_df = comparison_df.drop('순위', axis=1)
+    # 테이블 데이터 포맷팅 (순위 열은 제외, 이미 정렬되어 있음)
+    comparison_df = pd.DataFrame({
+        '지역': df['지역'],
+        '월평균 매출': format_currency_array(df['월평균 매출'].to_numpy(dtype=np.float64) * 10000),
+        '카페 수': df['카페 수'],
+        '폐업률': np.char.mod("%.1f%%", df['폐업률'].to_numpy(dtype=np.float64)),
+        '여성 비율': np.char.mod("%.0f%%", df['여성 비율'].to_numpy(dtype=np.float64)),
+        '객단가': [f"{price:,}원" for price in df['객단가'].to_numpy().astype(np.int64)],
+        '종합 점수': np.char.mod("%.1f점", df['종합 점수'].to_numpy(dtype=np.float64))
+    })
     
     st.dataframe(
         comparison_df,
@@ -1036,6 +1108,21 @@ def display_comparison():
         }
     )
 
+def summarize_recommendations(recommendations):
+    """인사이트용 집계 (지표별 배열로 변환 후 벡터 연산, 동률이면 앞 순위 우선)"""
+    count = len(recommendations)
+    revenues = np.fromiter((r.avg_revenue_per_store for r in recommendations), dtype=np.float64, count=count)
+    stores = np.fromiter((r.store_count for r in recommendations), dtype=np.float64, count=count)
+    closures = np.fromiter((r.closure_rate for r in recommendations), dtype=np.float64, count=count)
+    
+    return {
+        'avg_revenue': revenues.mean(),
+        'avg_competition': stores.mean(),
+        'top_revenue': recommendations[int(revenues.argmax())],
+        'min_competition': recommendations[int(stores.argmin())],
+        'min_closure': recommendations[int(closures.argmin())]
+    }
+
 def display_insights():
     """인사이트 표시"""
     st.markdown("## 💡 종합 분석 인사이트")
@@ -1043,6 +1130,8 @@ def display_insights():
     if not st.session_state.recommendations:
         return
     
+    summary = summarize_recommendations(st.session_state.recommendations)
+    
     # 분석 요약
     col1, col2, col3 = st.columns(3)
     
@@ -1054,15 +1143,15 @@ def display_insights():
         )
     
     with col2:
-        avg_revenue = sum(r.avg_revenue_per_store for r in st.session_state.recommendations) / len(st.session_state.recommendations)
+        avg_revenue = summary['avg_revenue']
         st.metric(
             "평균 예상 매출",
-            format_number_for_display(avg_revenue, "currency"),
+            format_currency(avg_revenue),
             help="추천 지역들의 평균 월매출"
         )
     
     with col3:
-        avg_competition = sum(r.store_count for r in st.session_state.recommendations) / len(st.session_state.recommendations)
+        avg_competition = summary['avg_competition']
         st.metric(
             "평균 경쟁 강도",
             f"{avg_competition:.0f}개 카페",
@@ -1081,24 +1170,24 @@ def display_insights():
         <div class="insight-box success-box">
             🏆 <b>최우수 추천 지역</b><br>
             {top_rec.dong_name}({top_rec.gu_name})이(가) 종합 1위입니다. 
-            월평균 <b>{format_number_for_display(top_rec.avg_revenue_per_store, "currency")}</b>의 매출이 예상되며, 
+            월평균 <b>{format_currency(top_rec.avg_revenue_per_store)}</b>의 매출이 예상되며, 
             {'지하철역이 있어 접근성이 우수합니다.' if top_rec.subway_access else '도보 고객 위주의 상권입니다.'}
         </div>
         """, unsafe_allow_html=True)
         
         # 최고 매출 지역
-        top_revenue = max(st.session_state.recommendations, key=lambda x: x.avg_revenue_per_store)
+        top_revenue = summary['top_revenue']
         if top_revenue != top_rec:
             st.markdown(f"""
             <div class="insight-box info-box">
                 💰 <b>최고 매출 지역</b><br>
-                {top_revenue.dong_name}이(가) 가장 높은 매출(<b>{format_number_for_display(top_revenue.avg_revenue_per_store, "currency")}</b>)을 
+                {top_revenue.dong_name}이(가) 가장 높은 매출(<b>{format_currency(top_revenue.avg_revenue_per_store)}</b>)을 
                 기록하고 있습니다. 프리미엄 전략이 유효한 지역입니다.
             </div>
             """, unsafe_allow_html=True)
         
         # 블루오션 지역
-        min_competition = min(st.session_state.recommendations, key=lambda x: x.store_count)
+        min_competition = summary['min_competition']
         st.markdown(f"""
         <div class="insight-box info-box">
             🌊 <b>블루오션 기회</b><br>
@@ -1108,7 +1197,7 @@ def display_insights():
         """, unsafe_allow_html=True)
         
         # 안정성 분석
-        min_closure = min(st.session_state.recommendations, key=lambda x: x.closure_rate)
+        min_closure = summary['min_closure']
         st.markdown(f"""
         <div class="insight-box success-box">
             🛡️ <b>가장 안정적인 지역</b><br>
@@ -1131,8 +1220,8 @@ def display_insights():
         "온/오프라인 마케팅 전략 수립"
     ]
     
-    for item in checklist:
-        st.checkbox(item, key=f"checklist_{checklist.index(item)}")
+    for idx, item in enumerate(checklist):
+        st.checkbox(item, key=f"checklist_{idx}")
     
     # 추가 리소스
     st.markdown("### 📚 유용한 자료")
@@ -1157,22 +1246,28 @@ def display_insights():
 
 # 메인 실행
 if not st.session_state.data_loaded:
-    # 초기 화면 - 로딩 전 환영 메시지
-    st.markdown("""
-    <div style="text-align: center; padding: 3rem 0;">
-        <h1 style="font-size: 3rem; margin-bottom: 2rem;">👋 환영합니다!</h1>
-        <p style="font-size: 1.2rem; color: #666; margin-bottom: 3rem;">
-            서울시 빅데이터를 기반으로 최적의 카페 창업 입지를 찾아드립니다.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # 시작 버튼
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if st.button("🚀 분석 시작하기", type="primary", use_container_width=True):
-            load_data()
+    # 초기 화면 - 로딩 전 환영 메시지 (로드 완료 시 같은 실행에서 비움)
+    welcome = st.empty()
+    with welcome.container():
+        st.markdown("""
+        <div style="text-align: center; padding: 3rem 0;">
+            <h1 style="font-size: 3rem; margin-bottom: 2rem;">👋 환영합니다!</h1>
+            <p style="font-size: 1.2rem; color: #666; margin-bottom: 3rem;">
+                서울시 빅데이터를 기반으로 최적의 카페 창업 입지를 찾아드립니다.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # 시작 버튼
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            start_clicked = st.button("🚀 분석 시작하기", type="primary", use_container_width=True)
     
+    if start_clicked:
+        load_data()
+        welcome.empty()
+
+if not st.session_state.data_loaded:
     # 서비스 소개
     st.markdown("---")
     st.markdown("### 💡 이런 분들에게 추천합니다")
@@ -1216,7 +1311,10 @@ if not st.session_state.data_loaded:
     
 else:
     if analyze_button:
-        run_analysis()
+        run_analysis(create_user_preferences(
+            min_revenue, max_revenue, gender_target, price_range,
+            competition, min_stores, subway, peak_time, weekday
+        ))
     
     display_results()
 
@@ -12,7 +12,7 @@ import pandas as pd
 import numpy as np
 from collections import defaultdict, deque
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any, Union
+from typing import Dict, List, Tuple, Optional, Any, Union, Set, Callable, Iterator, ClassVar
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 import warnings
@@ -113,6 +113,27 @@ class Config:
         'utf-8', 'utf-8-sig', 'cp949', 'euc-kr'
     ])
     
+    # CSV 옆에 Parquet 캐시를 만들어 재사용 (CSV 재파싱 생략)
+    use_parquet_cache: bool = True
+    
+    # 대용량 CSV(생활인구 등) 청크 단위 읽기 크기
+    csv_chunksize: int = 500_000
+    
+    # CSV 파서 엔진 ('pyarrow'는 멀티스레드 파싱, 설치되어 있지 않으면 'c'로 대체)
+    csv_engine: str = 'pyarrow'
+    
+    # 컬럼 유형별 dtype (CSV 타입 추론 생략)
+    column_dtypes: Dict[str, str] = field(default_factory=lambda: {
+        'dong_code': 'str',
+        'service_code': 'str',
+        'revenue': 'float64',
+        'sales_count': 'float64',
+        'store_count': 'float64',
+        'open_rate': 'float64',
+        'close_rate': 'float64',
+        'franchise': 'float64'
+    })
+    
     # 컬럼명 매핑
     column_mappings: Dict[str, List[str]] = field(default_factory=lambda: {
         'dong_code': ['행정동코드', '행정동_코드', 'admdong_cd', 'dong_code'],
@@ -155,7 +176,7 @@ class Config:
     })
 
 
-@dataclass
+@dataclass(slots=True)
 class DongInfo:
     """행정동 정보"""
     code: str
@@ -167,7 +188,7 @@ class DongInfo:
         return f"{self.name} ({self.gu_name})"
 
 
-@dataclass
+@dataclass(slots=True)
 class SalesData:
     """매출 데이터"""
     revenue: float
@@ -183,6 +204,15 @@ class SalesData:
     evening_revenue: float = 0   # 17-21시
     night_revenue: float = 0     # 21-24시
     
+    # 시간대 → 매출 필드명
+    TIME_SLOT_FIELDS: ClassVar[Dict[str, str]] = {
+        'morning': 'morning_revenue',
+        'lunch': 'lunch_revenue',
+        'afternoon': 'afternoon_revenue',
+        'evening': 'evening_revenue',
+        'night': 'night_revenue'
+    }
+    
     @property
     def female_ratio(self) -> float:
         """여성 매출 비율"""
@@ -200,18 +230,11 @@ class SalesData:
         if self.revenue == 0:
             return 0
         
-        time_revenues = {
-            'morning': self.morning_revenue,
-            'lunch': self.lunch_revenue,
-            'afternoon': self.afternoon_revenue,
-            'evening': self.evening_revenue,
-            'night': self.night_revenue
-        }
-        
-        return time_revenues.get(time_slot, 0) / self.revenue
+        field_name = self.TIME_SLOT_FIELDS.get(time_slot)
+        return getattr(self, field_name) / self.revenue if field_name else 0
 
 
-@dataclass
+@dataclass(slots=True)
 class StoreData:
     """점포 데이터"""
     store_count: int
@@ -227,7 +250,7 @@ class StoreData:
         return (1 - self.close_rate) * (1 / (1 + np.log(max(self.store_count, 1))))
 
 
-@dataclass
+@dataclass(slots=True)
 class PopulationData:
     """생활인구 데이터"""
     total_population: float
@@ -318,11 +341,171 @@ def format_korean_number(num: int) -> str:
     return result
 
 
+def code_strings(values: pd.Series) -> pd.Series:
+    """코드 컬럼을 str()과 같은 규칙의 문자열로 변환 (결측값은 'nan')"""
+    return values.astype(str).fillna('nan')
+
+
+def parquet_cache_path(filepath: str) -> str:
+    """CSV 파일에 대응하는 Parquet 캐시 경로"""
+    return os.path.splitext(filepath)[0] + '.parquet'
+
+
+def resolve_csv_engine(engine: str) -> str:
+    """사용 가능한 CSV 파서 엔진 (pyarrow가 없으면 기본 C 엔진)"""
+    if engine == 'pyarrow':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return 'c'
+    return engine
+
+
+def read_table(
+    filepath: str,
+    encodings: List[str],
+    use_parquet_cache: bool = True,
+    columns: Optional[Set[str]] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    engine: str = 'c',
+    row_filter: Optional[Tuple[List[str], Any]] = None
+) -> Optional[pd.DataFrame]:
+    """CSV 파일 읽기 (최신 Parquet 캐시가 있으면 우선 사용하고, 없으면 생성)
+    
+    columns를 지정하면 해당 컬럼만 읽고, dtype을 지정하면 타입 추론을 생략한다.
+    row_filter(후보 컬럼명, 값)를 지정하면 처음 존재하는 후보 컬럼이 값과 같은 행만 남긴다
+    (일치하는 행이 없으면 전체 유지).
+    """
+    parquet_path = parquet_cache_path(filepath)
+    
+    if (use_parquet_cache and os.path.exists(parquet_path)
+            and os.path.getmtime(parquet_path) >= os.path.getmtime(filepath)):
+        try:
+            df = _read_parquet_cache(parquet_path, columns, row_filter)
+            if dtype:
+                df = df.astype({col: t for col, t in dtype.items() if col in df.columns})
+            logger.info(f"파일 로드 성공: {parquet_path} (Parquet 캐시)")
+            return df
+        except Exception as e:
+            logger.warning(f"Parquet 캐시 로드 실패, CSV로 대체: {parquet_path} ({e})")
+    
+    # 캐시는 모든 컬럼으로 생성 (로더마다 필요한 컬럼이 다름)
+    usecols = columns if not use_parquet_cache else None
+    
+    df = _read_csv_with_fallback(filepath, encodings, usecols, dtype, resolve_csv_engine(engine))
+    if df is None:
+        return None
+    
+    if use_parquet_cache:
+        _write_parquet_cache(df, parquet_path)
+        if columns is not None:
+            df = df[[col for col in df.columns if col.strip() in columns]]
+    return _apply_row_filter(df, row_filter)
+
+
+def _row_filter_column(names: List[str], row_filter: Optional[Tuple[List[str], Any]]) -> Optional[str]:
+    """행 필터 후보 컬럼 중 처음 존재하는 컬럼명"""
+    if row_filter is None:
+        return None
+    present = set(names)
+    return next((name for name in row_filter[0] if name in present), None)
+
+
+def _apply_row_filter(df: pd.DataFrame, row_filter: Optional[Tuple[List[str], Any]]) -> pd.DataFrame:
+    """메모리에서 행 필터 적용 (일치하는 행이 없으면 그대로 반환)"""
+    column = _row_filter_column(list(df.columns), row_filter)
+    if column is None:
+        return df
+    
+    mask = df[column] == row_filter[1]
+    return df[mask] if mask.any() else df
+
+
+def _read_csv_with_fallback(
+    filepath: str,
+    encodings: List[str],
+    columns: Optional[Set[str]],
+    dtype: Optional[Dict[str, str]],
+    engine: str = 'c'
+) -> Optional[pd.DataFrame]:
+    """인코딩별로 CSV 읽기 (dtype 변환 실패 시 타입 추론으로 재시도)"""
+    dtype_options = [dtype, None] if dtype else [None]
+    
+    for encoding in encodings:
+        usecols = None
+        if columns is not None:
+            usecols = lambda col: col.strip() in columns
+            if engine == 'pyarrow':
+                # pyarrow 엔진은 callable usecols를 지원하지 않아 헤더로 컬럼명 확정
+                try:
+                    header = pd.read_csv(filepath, encoding=encoding, nrows=0)
+                except Exception:
+                    continue
+                usecols = [col for col in header.columns if usecols(col)]
+        
+        for dtype_option in dtype_options:
+            try:
+                df = pd.read_csv(
+                    filepath, encoding=encoding, usecols=usecols,
+                    dtype=dtype_option, engine=engine
+                )
+            except UnicodeDecodeError:
+                break
+            except Exception:
+                continue
+            
+            logger.info(f"파일 로드 성공: {filepath} (encoding: {encoding}, engine: {engine})")
+            return df
+    
+    return None
+
+
+def _read_parquet_cache(
+    parquet_path: str,
+    columns: Optional[Set[str]],
+    row_filter: Optional[Tuple[List[str], Any]] = None
+) -> pd.DataFrame:
+    """Parquet 캐시 읽기 (필요한 컬럼만, 행 필터는 pyarrow 읽기 단계에서 적용)"""
+    if columns is None and row_filter is None:
+        return pd.read_parquet(parquet_path)
+    
+    import pyarrow.parquet as pq
+    schema_names = pq.read_schema(parquet_path).names
+    names = None if columns is None else [col for col in schema_names if col.strip() in columns]
+    
+    filter_column = _row_filter_column(schema_names, row_filter)
+    if filter_column is not None:
+        try:
+            df = pd.read_parquet(parquet_path, columns=names, filters=[(filter_column, '==', row_filter[1])])
+            if len(df) > 0:
+                return df
+        except Exception as e:
+            logger.debug(f"Parquet 행 필터 적용 실패, 전체 로드: {parquet_path} ({e})")
+    return _apply_row_filter(pd.read_parquet(parquet_path, columns=names), row_filter)
+
+
+def _write_parquet_cache(df: pd.DataFrame, parquet_path: str) -> None:
+    """Parquet 캐시 저장 (실패해도 CSV 로드 결과에는 영향 없음)"""
+    tmp_path = parquet_path + '.tmp'
+    try:
+        df.to_parquet(tmp_path, compression='zstd', index=False)
+        os.replace(tmp_path, parquet_path)
+        logger.info(f"Parquet 캐시 생성: {parquet_path}")
+    except Exception as e:
+        logger.warning(f"Parquet 캐시 생성 실패: {parquet_path} ({e})")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 # ==================== Abstract Base Classes ====================
 
 class DataLoader(ABC):
     """데이터 로더 추상 클래스"""
     
+    # 읽어올 컬럼 유형(column_mappings 키)과 고정 컬럼명별 dtype (비어 있으면 전체 컬럼)
+    COLUMN_TYPES: Tuple[str, ...] = ()
+    EXTRA_COLUMNS: Dict[str, Optional[str]] = {}
+    
     def __init__(self, config: Config):
         self.config = config
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
@@ -333,32 +516,63 @@ class DataLoader(ABC):
         pass
     
     def _read_csv_with_encoding(self, filepath: str) -> Optional[pd.DataFrame]:
-        """여러 인코딩을 시도하여 CSV 파일 읽기"""
-        for encoding in self.config.encodings:
-            try:
-                df = pd.read_csv(filepath, encoding=encoding)
-                self.logger.info(f"파일 로드 성공: {filepath} (encoding: {encoding})")
-                return df
-            except Exception as e:
-                continue
-        
-        self.logger.error(f"파일 로드 실패: {filepath}")
-        return None
+        """여러 인코딩을 시도하여 CSV 파일 읽기 (Parquet 캐시 우선)"""
+        columns, dtype = self._column_spec()
+        df = read_table(
+            filepath, self.config.encodings, self.config.use_parquet_cache,
+            columns=columns, dtype=dtype, engine=self.config.csv_engine,
+            row_filter=self._row_filter()
+        )
+        if df is None:
+            self.logger.error(f"파일 로드 실패: {filepath}")
+        return df
     
-    def _find_column(self, df: pd.DataFrame, column_type: str) -> Optional[str]:
-        """컬럼명 매핑을 통해 실제 컬럼명 찾기"""
-        possible_names = self.config.column_mappings.get(column_type, [])
-        for name in possible_names:
-            if name in df.columns:
-                return name
+    def _row_filter(self) -> Optional[Tuple[List[str], Any]]:
+        """읽기 단계에서 적용할 행 필터 (후보 컬럼명, 값)"""
         return None
     
+    def _column_spec(self) -> Tuple[Optional[Set[str]], Dict[str, str]]:
+        """읽어올 컬럼명(후보명 전체)과 dtype"""
+        if not self.COLUMN_TYPES and not self.EXTRA_COLUMNS:
+            return None, {}
+        
+        columns = set(self.EXTRA_COLUMNS)
+        dtype = {col: t for col, t in self.EXTRA_COLUMNS.items() if t is not None}
+        for column_type in self.COLUMN_TYPES:
+            names = self.config.column_mappings.get(column_type, [])
+            columns.update(names)
+            if column_type in self.config.column_dtypes:
+                dtype.update(dict.fromkeys(names, self.config.column_dtypes[column_type]))
+        return columns, dtype
+    
+    def _resolve_columns(self, df: pd.DataFrame, column_types: Tuple[str, ...]) -> Dict[str, Optional[str]]:
+        """컬럼 유형별 실제 컬럼명을 로드 시 한 번에 찾기"""
+        present = set(df.columns)
+        return {
+            column_type: next(
+                (name for name in self.config.column_mappings.get(column_type, []) if name in present),
+                None
+            )
+            for column_type in column_types
+        }
+    
     def _safe_float(self, value: Any, default: float = 0.0) -> float:
         """안전한 float 변환"""
         try:
             return float(value)
         except (ValueError, TypeError):
             return default
+    
+    def _column_values(self, df: pd.DataFrame, column: Optional[str]) -> np.ndarray:
+        """컬럼을 float 배열로 변환 (없는 컬럼은 0, 숫자형이 아니면 _safe_float 규칙 적용)"""
+        if column is None or column not in df.columns:
+            return np.zeros(len(df))
+        
+        values = df[column]
+        if pd.api.types.is_numeric_dtype(values):
+            # 블록 슬라이스가 strided 뷰로 나오는 경우에만 연속 배열로 복사
+            return np.ascontiguousarray(values.to_numpy(dtype=np.float64))
+        return np.fromiter((self._safe_float(v) for v in values), dtype=np.float64, count=len(values))
 
 
 class BaseOptimizer(ABC):
@@ -379,6 +593,9 @@ class BaseOptimizer(ABC):
 class DongMappingLoader(DataLoader):
     """행정동 매핑 데이터 로더"""
     
+    COLUMN_TYPES = ('dong_code',)
+    EXTRA_COLUMNS = {'읍면동명': None, '시군구명': None, '시도명': None}
+    
     def load(self, filepath: str) -> Dict[str, DongInfo]:
         """행정동 매핑 데이터 로드"""
         if not os.path.exists(filepath):
@@ -407,18 +624,20 @@ class DongMappingLoader(DataLoader):
         dong_mapping = {}
         df.columns = df.columns.str.strip()
         
-        dong_col = self._find_column(df, 'dong_code')
+        dong_col = self._resolve_columns(df, self.COLUMN_TYPES)['dong_code']
         if dong_col is None:
             self.logger.error("행정동 코드 컬럼을 찾을 수 없습니다.")
             return {}
         
-        for _, row in df.iterrows():
-            dong_code_raw = str(row[dong_col])
+        # 이름 컬럼이 없으면 빈 문자열로 채워 튜플 단위로 순회
+        rows = df.reindex(columns=[dong_col, *self.EXTRA_COLUMNS], fill_value='')
+        for dong_code, name, gu_name, si_name in rows.itertuples(index=False, name=None):
+            dong_code_raw = str(dong_code)
             dong_info = DongInfo(
                 code=dong_code_raw,
-                name=row.get('읍면동명', ''),
-                gu_name=row.get('시군구명', ''),
-                si_name=row.get('시도명', '')
+                name=name,
+                gu_name=gu_name,
+                si_name=si_name
             )
             
             # 다양한 형태로 저장 (매칭률 향상)
@@ -447,6 +666,22 @@ class DongMappingLoader(DataLoader):
 class SalesDataLoader(DataLoader):
     """매출 데이터 로더"""
     
+    # SalesData 필드 → 원본 컬럼명
+    FIELD_COLUMNS: Dict[str, str] = {
+        'female_revenue': '여성_매출_금액',
+        'male_revenue': '남성_매출_금액',
+        'weekday_revenue': '주중_매출_금액',
+        'weekend_revenue': '주말_매출_금액',
+        'morning_revenue': '시간대_06~11_매출_금액',
+        'lunch_revenue': '시간대_11~14_매출_금액',
+        'afternoon_revenue': '시간대_14~17_매출_금액',
+        'evening_revenue': '시간대_17~21_매출_금액',
+        'night_revenue': '시간대_21~24_매출_금액'
+    }
+    
+    COLUMN_TYPES = ('dong_code', 'service_code', 'revenue', 'sales_count')
+    EXTRA_COLUMNS = dict.fromkeys(FIELD_COLUMNS.values(), 'float64')
+    
     def load(self, filepath: str) -> Dict[str, SalesData]:
         """매출 데이터 로드"""
         if not os.path.exists(filepath):
@@ -457,16 +692,20 @@ class SalesDataLoader(DataLoader):
         if df is None:
             return {}
         
+        columns = self._resolve_columns(df, self.COLUMN_TYPES)
+        
         # 카페 데이터만 필터링
-        df_filtered = self._filter_cafe_data(df)
+        df_filtered = self._filter_cafe_data(df, columns['service_code'])
         
         # 매출 데이터 처리
-        return self._process_sales_data(df_filtered)
+        return self._process_sales_data(df_filtered, columns)
     
-    def _filter_cafe_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _row_filter(self) -> Optional[Tuple[List[str], Any]]:
+        """카페 서비스 코드 행만 읽기"""
+        return self.config.column_mappings.get('service_code', []), self.config.CAFE_SERVICE_CODE
+    
+    def _filter_cafe_data(self, df: pd.DataFrame, service_col: Optional[str]) -> pd.DataFrame:
         """카페 데이터만 필터링"""
-        service_col = self._find_column(df, 'service_code')
-        
         if service_col and self.config.CAFE_SERVICE_CODE in df[service_col].values:
             cafe_df = df[df[service_col] == self.config.CAFE_SERVICE_CODE]
             self.logger.info(f"카페 데이터: {len(cafe_df)}개")
@@ -475,50 +714,44 @@ class SalesDataLoader(DataLoader):
             self.logger.warning("카페 서비스 코드를 찾을 수 없어 전체 데이터 사용")
             return df
     
-    def _process_sales_data(self, df: pd.DataFrame) -> Dict[str, SalesData]:
-        """매출 데이터 처리"""
-        sales_data = {}
-        
-        dong_col = self._find_column(df, 'dong_code')
-        revenue_col = self._find_column(df, 'revenue')
-        count_col = self._find_column(df, 'sales_count')
+    def _process_sales_data(self, df: pd.DataFrame, columns: Dict[str, Optional[str]]) -> Dict[str, SalesData]:
+        """매출 데이터 처리 (행 단위 반복 대신 컬럼 단위 연산)"""
+        dong_col = columns['dong_code']
+        revenue_col = columns['revenue']
+        count_col = columns['sales_count']
         
         if not all([dong_col, revenue_col]):
             self.logger.error("필수 컬럼을 찾을 수 없습니다.")
             return {}
         
-        for _, row in df.iterrows():
-            dong_code = str(row[dong_col])
-            revenue = self._safe_float(row.get(revenue_col, 0))
-            
-            if revenue > 0:
-                sales_data[dong_code] = self._create_sales_data(row, revenue_col, count_col)
+        # 매출이 있는 행만 남기고 필드별 배열 추출
+        revenue = self._column_values(df, revenue_col)
+        mask = revenue > 0
+        revenue = revenue[mask]
+        sales_count = self._column_values(df, count_col)[mask]
+        avg_price = np.divide(revenue, sales_count, out=np.zeros_like(revenue), where=sales_count > 0)
+        codes = code_strings(df[dong_col]).to_numpy()[mask]
+        
+        field_names = list(self.FIELD_COLUMNS)
+        field_values = [self._column_values(df, col)[mask].tolist() for col in self.FIELD_COLUMNS.values()]
+        
+        sales_data = {
+            dong_code: SalesData(
+                revenue=rev,
+                sales_count=count,
+                avg_price=price,
+                **dict(zip(field_names, values))
+            )
+            for dong_code, rev, count, price, *values in zip(
+                codes, revenue.tolist(), sales_count.tolist(), avg_price.tolist(), *field_values
+            )
+        }
         
         self.logger.info(f"{len(sales_data)}개 행정동 매출 데이터 로드 완료")
         self._log_top_sales(sales_data)
         
         return sales_data
     
-    def _create_sales_data(self, row: pd.Series, revenue_col: str, count_col: str) -> SalesData:
-        """SalesData 객체 생성"""
-        revenue = self._safe_float(row.get(revenue_col, 0))
-        sales_count = self._safe_float(row.get(count_col, 0))
-        
-        return SalesData(
-            revenue=revenue,
-            sales_count=sales_count,
-            avg_price=revenue / sales_count if sales_count > 0 else 0,
-            female_revenue=self._safe_float(row.get('여성_매출_금액', 0)),
-            male_revenue=self._safe_float(row.get('남성_매출_금액', 0)),
-            weekday_revenue=self._safe_float(row.get('주중_매출_금액', 0)),
-            weekend_revenue=self._safe_float(row.get('주말_매출_금액', 0)),
-            morning_revenue=self._safe_float(row.get('시간대_06~11_매출_금액', 0)),
-            lunch_revenue=self._safe_float(row.get('시간대_11~14_매출_금액', 0)),
-            afternoon_revenue=self._safe_float(row.get('시간대_14~17_매출_금액', 0)),
-            evening_revenue=self._safe_float(row.get('시간대_17~21_매출_금액', 0)),
-            night_revenue=self._safe_float(row.get('시간대_21~24_매출_금액', 0))
-        )
-    
     def _log_top_sales(self, sales_data: Dict[str, SalesData], top_n: int = 5) -> None:
         """상위 매출 로그"""
         top_sales = sorted(sales_data.items(), 
@@ -533,6 +766,8 @@ class SalesDataLoader(DataLoader):
 class StoreDataLoader(DataLoader):
     """점포 데이터 로더"""
     
+    COLUMN_TYPES = ('dong_code', 'service_code', 'store_count', 'open_rate', 'close_rate', 'franchise')
+    
     def load(self, filepath: str) -> Dict[str, StoreData]:
         """점포 데이터 로드"""
         if not os.path.exists(filepath):
@@ -543,16 +778,20 @@ class StoreDataLoader(DataLoader):
         if df is None:
             return {}
         
+        columns = self._resolve_columns(df, self.COLUMN_TYPES)
+        
         # 카페 데이터만 필터링
-        df_filtered = self._filter_cafe_data(df)
+        df_filtered = self._filter_cafe_data(df, columns['service_code'])
         
         # 점포 데이터 처리
-        return self._process_store_data(df_filtered)
+        return self._process_store_data(df_filtered, columns)
+    
+    def _row_filter(self) -> Optional[Tuple[List[str], Any]]:
+        """카페 서비스 코드 행만 읽기"""
+        return self.config.column_mappings.get('service_code', []), self.config.CAFE_SERVICE_CODE
     
-    def _filter_cafe_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _filter_cafe_data(self, df: pd.DataFrame, service_col: Optional[str]) -> pd.DataFrame:
         """카페 데이터만 필터링"""
-        service_col = self._find_column(df, 'service_code')
-        
         if service_col and self.config.CAFE_SERVICE_CODE in df[service_col].values:
             cafe_df = df[df[service_col] == self.config.CAFE_SERVICE_CODE]
             self.logger.info(f"카페 점포 데이터: {len(cafe_df)}개")
@@ -561,47 +800,37 @@ class StoreDataLoader(DataLoader):
             self.logger.warning("카페 서비스 코드를 찾을 수 없어 전체 데이터 사용")
             return df
     
-    def _process_store_data(self, df: pd.DataFrame) -> Dict[str, StoreData]:
-        """점포 데이터 처리"""
-        store_data = {}
-        
-        dong_col = self._find_column(df, 'dong_code')
+    def _process_store_data(self, df: pd.DataFrame, columns: Dict[str, Optional[str]]) -> Dict[str, StoreData]:
+        """점포 데이터 처리 (행 단위 반복 대신 컬럼 단위 연산)"""
+        dong_col = columns['dong_code']
         if dong_col is None:
             self.logger.error("행정동 코드 컬럼을 찾을 수 없습니다.")
             return {}
         
-        for _, row in df.iterrows():
-            dong_code = str(row[dong_col])
-            store_data[dong_code] = self._create_store_data(row)
+        store_count, open_rate, close_rate, franchise = (
+            self._column_values(df, columns[column_type])
+            for column_type in ('store_count', 'open_rate', 'close_rate', 'franchise')
+        )
+        
+        # 퍼센트 처리
+        open_rate = np.where(open_rate > 1, open_rate / 100, open_rate)
+        close_rate = np.where(close_rate > 1, close_rate / 100, close_rate)
+        
+        store_data = {
+            dong_code: StoreData(
+                store_count=int(count),
+                open_rate=opened,
+                close_rate=closed,
+                franchise_count=int(franchise_count)
+            )
+            for dong_code, count, opened, closed, franchise_count in zip(
+                code_strings(df[dong_col]).to_numpy(), store_count.tolist(),
+                open_rate.tolist(), close_rate.tolist(), franchise.tolist()
+            )
+        }
         
         self.logger.info(f"{len(store_data)}개 행정동 점포 데이터 로드 완료")
         return store_data
-    
-    def _create_store_data(self, row: pd.Series) -> StoreData:
-        """StoreData 객체 생성"""
-        store_count = self._safe_float(self._get_column_value(row, 'store_count'))
-        open_rate = self._safe_float(self._get_column_value(row, 'open_rate'))
-        close_rate = self._safe_float(self._get_column_value(row, 'close_rate'))
-        franchise = self._safe_float(self._get_column_value(row, 'franchise'))
-        
-        # 퍼센트 처리
-        open_rate = open_rate / 100 if open_rate > 1 else open_rate
-        close_rate = close_rate / 100 if close_rate > 1 else close_rate
-        
-        return StoreData(
-            store_count=int(store_count),
-            open_rate=open_rate,
-            close_rate=close_rate,
-            franchise_count=int(franchise)
-        )
-    
-    def _get_column_value(self, row: pd.Series, column_type: str) -> Any:
-        """컬럼 값 가져오기"""
-        possible_names = self.config.column_mappings.get(column_type, [])
-        for name in possible_names:
-            if name in row.index:
-                return row[name]
-        return 0
 
 
 # ==================== Core Components ====================
@@ -611,6 +840,9 @@ class NetworkAnalyzer:
     
     def __init__(self):
         self.flow_network = defaultdict(lambda: defaultdict(int))
+        self.reverse_network: Dict[str, Dict[str, float]] = {}
+        self.inflow_totals: Dict[str, float] = {}
+        self.outflow_totals: Dict[str, float] = {}
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
     
     def build_network(self, od_data: pd.DataFrame) -> None:
@@ -619,55 +851,63 @@ class NetworkAnalyzer:
             self.logger.warning("OD 데이터가 없어 기본 네트워크 사용")
             return
         
-        valid_count = 0
-        skipped_count = 0
+        origin = self._od_code_column(od_data, 'o_admdong_cd')
+        dest = self._od_code_column(od_data, 'd_admdong_cd')
+        if 'total_cnt' in od_data.columns:
+            flow = pd.to_numeric(od_data['total_cnt'], errors='coerce').to_numpy(dtype=np.float64)
+        else:
+            flow = np.zeros(len(od_data))
+        
+        valid = (origin != '') & (dest != '') & (origin != dest) & (flow > 0)
+        valid_count = int(valid.sum())
+        skipped_count = len(od_data) - valid_count
+        
+        # 같은 (출발, 도착) 쌍은 행 순서대로 먼저 합산한 뒤 한 번만 반영
+        edge_ids, edges = pd.factorize(pd.MultiIndex.from_arrays([origin[valid], dest[valid]]))
+        edge_flows = np.zeros(len(edges))
+        np.add.at(edge_flows, edge_ids, flow[valid])
         
-        for _, row in od_data.iterrows():
-            if self._process_od_record(row):
-                valid_count += 1
-            else:
-                skipped_count += 1
+        for (o, d), edge_flow in zip(edges, edge_flows.tolist()):
+            self.flow_network[o][d] += edge_flow
+        
+        self._index_flows()
         
         self.logger.info(
             f"네트워크 구축 완료: {len(self.flow_network)} 노드, "
             f"{valid_count}개 엣지, {skipped_count}개 스킵"
         )
     
-    def _process_od_record(self, row: pd.Series) -> bool:
-        """OD 레코드 처리"""
-        try:
-            origin = str(row.get('o_admdong_cd', '')).strip()
-            dest = str(row.get('d_admdong_cd', '')).strip()
-            flow = float(row.get('total_cnt', 0))
-            
-            if origin and dest and origin != dest and flow > 0:
-                self.flow_network[origin][dest] += flow
-                return True
-            
-            return False
-        except Exception:
-            return False
+    def _od_code_column(self, od_data: pd.DataFrame, column: str) -> np.ndarray:
+        """OD 행정동 코드 컬럼을 정제된 문자열 배열로 변환 (없으면 빈 문자열)"""
+        if column not in od_data.columns:
+            return np.full(len(od_data), '', dtype=object)
+        return code_strings(od_data[column]).str.strip().to_numpy()
+    
+    def _index_flows(self) -> None:
+        """전체 엣지를 한 번 순회해 역방향 인접 목록과 행정동별 총 유입/유출량 집계"""
+        reverse = defaultdict(dict)
+        outflow = {}
+        
+        for origin, dests in self.flow_network.items():
+            outflow[origin] = sum(dests.values())
+            for dest, flow in dests.items():
+                reverse[dest][origin] = flow
+        
+        self.reverse_network = dict(reverse)
+        self.inflow_totals = {dest: sum(origins.values()) for dest, origins in self.reverse_network.items()}
+        self.outflow_totals = outflow
     
     def calculate_inflow(self, dong_code: str) -> float:
         """특정 행정동으로의 총 유입량 계산"""
-        return sum(
-            self.flow_network[origin][dong_code]
-            for origin in self.flow_network
-            if dong_code in self.flow_network[origin]
-        )
+        return self.inflow_totals.get(dong_code, 0)
     
     def calculate_outflow(self, dong_code: str) -> float:
         """특정 행정동에서의 총 유출량 계산"""
-        if dong_code in self.flow_network:
-            return sum(self.flow_network[dong_code].values())
-        return 0
+        return self.outflow_totals.get(dong_code, 0)
     
     def get_top_flows(self, dong_code: str, top_n: int = 3) -> Dict[str, List[Tuple[str, float]]]:
         """상위 유입/유출 경로"""
-        inflows = {}
-        for origin in self.flow_network:
-            if dong_code in self.flow_network[origin]:
-                inflows[origin] = self.flow_network[origin][dong_code]
+        inflows = self.reverse_network.get(dong_code, {})
         
         outflows = {}
         if dong_code in self.flow_network:
@@ -722,33 +962,40 @@ class ObjectiveCalculator:
         return objectives
     
     def normalize(self, all_objectives: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
-        """목적함수 정규화 (Min-Max Normalization)"""
+        """목적함수 정규화 (Min-Max Normalization, 목적별 열 단위 일괄 계산)"""
         if not all_objectives:
             return {}
         
-        normalized = {}
-        objective_names = list(next(iter(all_objectives.values())).keys())
-        
-        for obj_name in objective_names:
-            values = [obj[obj_name] for obj in all_objectives.values()]
-            min_val = min(values) if values else 0
-            max_val = max(values) if values else 1
-            
-            for dong, objectives in all_objectives.items():
-                if dong not in normalized:
-                    normalized[dong] = {}
-                
-                if max_val > min_val:
-                    normalized[dong][obj_name] = (objectives[obj_name] - min_val) / (max_val - min_val)
-                else:
-                    normalized[dong][obj_name] = 0.5
+        dongs = list(all_objectives)
+        objective_names = list(all_objectives[dongs[0]])
+        values = np.fromiter(
+            (all_objectives[dong][obj_name] for dong in dongs for obj_name in objective_names),
+            dtype=np.float64,
+            count=len(dongs) * len(objective_names)
+        ).reshape(len(dongs), len(objective_names))
+        
+        # 값 범위가 0인 목적함수는 0.5로 채움
+        min_vals = values.min(axis=0)
+        value_range = values.max(axis=0) - min_vals
+        has_range = value_range > 0
+        scaled = np.where(
+            has_range,
+            (values - min_vals) / np.where(has_range, value_range, 1.0),
+            0.5
+        )
         
-        return normalized
+        return {dong: dict(zip(objective_names, row)) for dong, row in zip(dongs, scaled.tolist())}
 
 
 class ParetoOptimizer:
     """파레토 최적화"""
     
+    # 지배 관계를 비교하는 목적함수와 한 번에 비교할 후보 수 (메모리 상한)
+    OBJECTIVE_KEYS: Tuple[str, ...] = ('수익성', '안정성', '접근성', '효율성')
+    BLOCK_SIZE: int = 1024
+    # 이 후보 수 이상이면 O(N²) 쌍 비교 대신 정렬 기반 스카이라인 사용
+    SKYLINE_MIN_SIZE: int = 2048
+    
     @staticmethod
     def dominates(obj1: Dict[str, float], obj2: Dict[str, float]) -> bool:
         """파레토 지배 관계 확인"""
@@ -766,26 +1013,80 @@ class ParetoOptimizer:
         return better_in_any
     
     def find_optimal(self, objectives: Dict[str, Dict[str, float]]) -> List[str]:
-        """파레토 최적해 찾기"""
-        pareto_optimal = []
+        """파레토 최적해 찾기 (후보가 많으면 정렬 기반 스카이라인, 적으면 브로드캐스팅)"""
+        if not objectives:
+            return []
         
-        for dong1 in objectives:
-            is_dominated = False
-            
-            for dong2 in objectives:
-                if dong1 != dong2 and self.dominates(objectives[dong2], objectives[dong1]):
-                    is_dominated = True
-                    break
-            
-            if not is_dominated:
-                pareto_optimal.append(dong1)
+        dongs = list(objectives)
+        first = objectives[dongs[0]]
+        keys = [key for key in self.OBJECTIVE_KEYS if key in first]
+        values = np.array(
+            [[objectives[dong][key] for key in keys] for dong in dongs],
+            dtype=np.float64
+        ).reshape(len(dongs), len(keys))
+        
+        if len(dongs) >= self.SKYLINE_MIN_SIZE and keys and np.isfinite(values).all():
+            optimal = self._sorted_skyline(values)
+        else:
+            optimal = ~self._dominated_mask(values)
         
-        return pareto_optimal
+        return [dongs[i] for i in np.flatnonzero(optimal)]
+    
+    def _dominated_mask(self, values: np.ndarray) -> np.ndarray:
+        """후보 쌍 비교를 블록 단위 NumPy 브로드캐스팅으로 수행"""
+        # dominated[i]: 어떤 j가 모든 목적에서 i보다 작지 않고 하나 이상에서 큰 경우
+        dominated = np.zeros(len(values), dtype=bool)
+        for start in range(0, len(values), self.BLOCK_SIZE):
+            block = values[start:start + self.BLOCK_SIZE, None, :]
+            no_worse = ~(values[None, :, :] < block).any(axis=2)
+            better = (values[None, :, :] > block).any(axis=2)
+            dominated[start:start + self.BLOCK_SIZE] = (no_worse & better).any(axis=1)
+        return dominated
+    
+    @staticmethod
+    def _sorted_skyline(values: np.ndarray) -> np.ndarray:
+        """사전식 내림차순으로 정렬한 뒤 현재 파레토 전선과만 비교 (SFS/BNL)"""
+        # 지배하는 후보는 항상 먼저 나오므로 전선에 없는 후보와는 비교할 필요가 없음
+        order = np.lexsort(-values.T[::-1])
+        front = np.empty_like(values)
+        size = 0
+        optimal = np.zeros(len(values), dtype=bool)
+        
+        for i in order:
+            point = values[i]
+            current = front[:size]
+            if ((current >= point).all(axis=1) & (current > point).any(axis=1)).any():
+                continue
+            front[size] = point
+            size += 1
+            optimal[i] = True
+        
+        return optimal
 
 
 class FilterManager:
     """필터 관리자"""
     
+    # 선호 Enum → filter_criteria 키
+    PEAK_TIME_SLOTS: Dict[PeakTime, str] = {
+        PeakTime.MORNING: 'morning',
+        PeakTime.LUNCH: 'lunch',
+        PeakTime.AFTERNOON: 'afternoon',
+        PeakTime.EVENING: 'evening'
+    }
+    PRICE_RANGE_KEYS: Dict[PriceRange, str] = {
+        PriceRange.LOW: 'low',
+        PriceRange.MID_LOW: 'mid_low',
+        PriceRange.MID: 'mid',
+        PriceRange.MID_HIGH: 'mid_high',
+        PriceRange.HIGH: 'high'
+    }
+    COMPETITION_KEYS: Dict[CompetitionLevel, str] = {
+        CompetitionLevel.BLUE_OCEAN: 'blue_ocean',
+        CompetitionLevel.MODERATE: 'moderate',
+        CompetitionLevel.COMPETITIVE: 'competitive'
+    }
+    
     def __init__(self, config: Config):
         self.config = config
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
@@ -796,234 +1097,183 @@ class FilterManager:
         preferences: UserPreferences,
         data_store: 'DataStore'
     ) -> List[str]:
-        """모든 필터 순차적 적용"""
-        filtered = candidates.copy()
+        """모든 필터 순차적 적용 (후보 지표를 한 번 모아 불리언 마스크로 결합)"""
+        columns = data_store.as_columns(candidates)
+        selected = np.ones(len(candidates), dtype=bool)
         
-        # 필터 체인
+        # 필터 체인 (필터명, 마스크 함수, 결과가 비면 이전 후보 유지 여부)
         filters = [
-            ('매출 범위', self._filter_by_revenue),
-            ('성별', self._filter_by_gender),
-            ('경쟁 환경', self._filter_by_competition),
-            ('지하철', self._filter_by_subway),
-            ('시간대', self._filter_by_peak_time),
-            ('주중/주말', self._filter_by_weekday),
-            ('객단가', self._filter_by_price),
-            ('최소 점포수', self._filter_by_min_stores)
+            ('매출 범위', self._filter_by_revenue, False),
+            ('성별', self._filter_by_gender, True),
+            ('경쟁 환경', self._filter_by_competition, True),
+            ('지하철', self._filter_by_subway, False),
+            ('시간대', self._filter_by_peak_time, True),
+            ('주중/주말', self._filter_by_weekday, True),
+            ('객단가', self._filter_by_price, True),
+            ('최소 점포수', self._filter_by_min_stores, False)
         ]
         
-        for filter_name, filter_func in filters:
-            before_count = len(filtered)
-            filtered = filter_func(filtered, preferences, data_store)
-            after_count = len(filtered)
+        for filter_name, filter_func, keep_if_empty in filters:
+            mask = filter_func(columns, preferences)
+            if mask is None:
+                continue
+            
+            narrowed = selected & mask
+            if keep_if_empty and not narrowed.any():
+                continue
+            
+            before_count = int(selected.sum())
+            after_count = int(narrowed.sum())
+            selected = narrowed
             
             if before_count != after_count:
                 self.logger.info(f"{filter_name} 필터: {before_count} → {after_count}개")
         
-        return filtered
+        return [dong for dong, keep in zip(candidates, selected.tolist()) if keep]
     
     def _filter_by_revenue(
         self,
-        candidates: List[str],
-        preferences: UserPreferences,
-        data_store: 'DataStore'
-    ) -> List[str]:
+        columns: Dict[str, np.ndarray],
+        preferences: UserPreferences
+    ) -> Optional[np.ndarray]:
         """매출 범위 필터"""
         min_revenue_won = preferences.min_revenue * 10_000
         max_revenue_won = preferences.max_revenue * 10_000
         
-        return [
-            dong for dong in candidates
-            if min_revenue_won <= data_store.get_sales_data(dong).revenue <= max_revenue_won
-        ]
+        revenue = columns['revenue']
+        return (min_revenue_won <= revenue) & (revenue <= max_revenue_won)
     
     def _filter_by_gender(
         self,
-        candidates: List[str],
-        preferences: UserPreferences,
-        data_store: 'DataStore'
-    ) -> List[str]:
+        columns: Dict[str, np.ndarray],
+        preferences: UserPreferences
+    ) -> Optional[np.ndarray]:
         """성별 필터"""
         if preferences.gender_target == GenderTarget.ANY:
-            return candidates
+            return None
         
-        filtered = []
         criteria = self.config.filter_criteria['gender_ratio']
+        female_ratio = columns['female_ratio']
         
-        for dong in candidates:
-            female_ratio = data_store.get_female_ratio(dong)
-            
-            if preferences.gender_target == GenderTarget.FEMALE_CENTERED:
-                if female_ratio >= criteria['female_centered']:
-                    filtered.append(dong)
-            elif preferences.gender_target == GenderTarget.MALE_CENTERED:
-                if female_ratio <= criteria['male_centered']:
-                    filtered.append(dong)
-            elif preferences.gender_target == GenderTarget.BALANCED:
-                min_ratio, max_ratio = criteria['balanced']
-                if min_ratio <= female_ratio <= max_ratio:
-                    filtered.append(dong)
-        
-        return filtered if filtered else candidates
+        if preferences.gender_target == GenderTarget.FEMALE_CENTERED:
+            return female_ratio >= criteria['female_centered']
+        elif preferences.gender_target == GenderTarget.MALE_CENTERED:
+            return female_ratio <= criteria['male_centered']
+        elif preferences.gender_target == GenderTarget.BALANCED:
+            min_ratio, max_ratio = criteria['balanced']
+            return (min_ratio <= female_ratio) & (female_ratio <= max_ratio)
+        
+        return np.zeros(len(female_ratio), dtype=bool)
     
     def _filter_by_competition(
         self,
-        candidates: List[str],
-        preferences: UserPreferences,
-        data_store: 'DataStore'
-    ) -> List[str]:
+        columns: Dict[str, np.ndarray],
+        preferences: UserPreferences
+    ) -> Optional[np.ndarray]:
         """경쟁 환경 필터"""
         if preferences.competition == CompetitionLevel.ANY:
-            return candidates
+            return None
         
-        filtered = []
-        criteria = self.config.filter_criteria['competition']
+        store_count = columns['store_count']
+        level_key = self.COMPETITION_KEYS.get(preferences.competition)
+        if not level_key:
+            return np.zeros(len(store_count), dtype=bool)
         
-        for dong in candidates:
-            store_count = data_store.get_store_count(dong)
-            
-            if preferences.competition == CompetitionLevel.BLUE_OCEAN:
-                min_stores, max_stores = criteria['blue_ocean']
-                if min_stores <= store_count <= max_stores:
-                    filtered.append(dong)
-            elif preferences.competition == CompetitionLevel.MODERATE:
-                min_stores, max_stores = criteria['moderate']
-                if min_stores <= store_count <= max_stores:
-                    filtered.append(dong)
-            elif preferences.competition == CompetitionLevel.COMPETITIVE:
-                min_stores, max_stores = criteria['competitive']
-                if min_stores <= store_count <= max_stores:
-                    filtered.append(dong)
-        
-        return filtered if filtered else candidates
+        min_stores, max_stores = self.config.filter_criteria['competition'][level_key]
+        return (min_stores <= store_count) & (store_count <= max_stores)
     
     def _filter_by_subway(
         self,
-        candidates: List[str],
-        preferences: UserPreferences,
-        data_store: 'DataStore'
-    ) -> List[str]:
+        columns: Dict[str, np.ndarray],
+        preferences: UserPreferences
+    ) -> Optional[np.ndarray]:
         """지하철 필터"""
         if preferences.subway == SubwayPreference.REQUIRED:
-            return [dong for dong in candidates if data_store.has_subway_access(dong)]
+            return columns['subway']
         
-        return candidates
+        return None
     
     def _filter_by_peak_time(
         self,
-        candidates: List[str],
-        preferences: UserPreferences,
-        data_store: 'DataStore'
-    ) -> List[str]:
+        columns: Dict[str, np.ndarray],
+        preferences: UserPreferences
+    ) -> Optional[np.ndarray]:
         """시간대 필터"""
         if preferences.peak_time == PeakTime.BALANCED:
-            return candidates
+            return None
         
-        filtered = []
         min_ratio = self.config.filter_criteria['time_ratio']['significant']
         
-        time_mapping = {
-            PeakTime.MORNING: 'morning',
-            PeakTime.LUNCH: 'lunch',
-            PeakTime.AFTERNOON: 'afternoon',
-            PeakTime.EVENING: 'evening'
-        }
-        
-        time_slot = time_mapping.get(preferences.peak_time)
+        time_slot = self.PEAK_TIME_SLOTS.get(preferences.peak_time)
         if not time_slot:
-            return candidates
-        
-        for dong in candidates:
-            sales_data = data_store.get_sales_data(dong)
-            if sales_data and sales_data.get_time_ratio(time_slot) >= min_ratio:
-                filtered.append(dong)
+            return None
         
-        return filtered if filtered else candidates
+        return columns[f'{time_slot}_ratio'] >= min_ratio
     
     def _filter_by_weekday(
         self,
-        candidates: List[str],
-        preferences: UserPreferences,
-        data_store: 'DataStore'
-    ) -> List[str]:
+        columns: Dict[str, np.ndarray],
+        preferences: UserPreferences
+    ) -> Optional[np.ndarray]:
         """주중/주말 필터"""
         if preferences.weekday_preference == WeekdayPreference.BALANCED:
-            return candidates
+            return None
         
-        filtered = []
         criteria = self.config.filter_criteria['weekday_ratio']
+        weekday_ratio = columns['weekday_ratio']
         
-        for dong in candidates:
-            sales_data = data_store.get_sales_data(dong)
-            if not sales_data:
-                continue
-            
-            weekday_ratio = sales_data.weekday_ratio
-            
-            if preferences.weekday_preference == WeekdayPreference.WEEKDAY:
-                if weekday_ratio >= criteria['weekday']:
-                    filtered.append(dong)
-            elif preferences.weekday_preference == WeekdayPreference.WEEKEND:
-                if weekday_ratio <= criteria['weekend']:
-                    filtered.append(dong)
+        if preferences.weekday_preference == WeekdayPreference.WEEKDAY:
+            return weekday_ratio >= criteria['weekday']
+        elif preferences.weekday_preference == WeekdayPreference.WEEKEND:
+            return weekday_ratio <= criteria['weekend']
         
-        return filtered if filtered else candidates
+        return np.zeros(len(weekday_ratio), dtype=bool)
     
     def _filter_by_price(
         self,
-        candidates: List[str],
-        preferences: UserPreferences,
-        data_store: 'DataStore'
-    ) -> List[str]:
+        columns: Dict[str, np.ndarray],
+        preferences: UserPreferences
+    ) -> Optional[np.ndarray]:
         """객단가 필터"""
         if preferences.price_range == PriceRange.ANY:
-            return candidates
+            return None
         
-        filtered = []
         criteria = self.config.filter_criteria['price_range']
         
-        price_mapping = {
-            PriceRange.LOW: 'low',
-            PriceRange.MID_LOW: 'mid_low',
-            PriceRange.MID: 'mid',
-            PriceRange.MID_HIGH: 'mid_high',
-            PriceRange.HIGH: 'high'
-        }
-        
-        price_key = price_mapping.get(preferences.price_range)
+        price_key = self.PRICE_RANGE_KEYS.get(preferences.price_range)
         if not price_key:
-            return candidates
+            return None
         
         min_price, max_price = criteria[price_key]
-        
-        for dong in candidates:
-            sales_data = data_store.get_sales_data(dong)
-            if sales_data and min_price <= sales_data.avg_price <= max_price:
-                filtered.append(dong)
-        
-        return filtered if filtered else candidates
+        avg_price = columns['avg_price']
+        return (min_price <= avg_price) & (avg_price <= max_price)
     
     def _filter_by_min_stores(
         self,
-        candidates: List[str],
-        preferences: UserPreferences,
-        data_store: 'DataStore'
-    ) -> List[str]:
+        columns: Dict[str, np.ndarray],
+        preferences: UserPreferences
+    ) -> Optional[np.ndarray]:
         """최소 점포수 필터"""
-        return [
-            dong for dong in candidates
-            if data_store.get_store_count(dong) >= preferences.min_stores
-        ]
+        return columns['store_count'] >= preferences.min_stores
 
 
 class DataStore:
     """데이터 저장소 (Repository Pattern)"""
     
+    # 저장 레코드 구조가 바뀌면 올려 피클 캐시 무효화
+    CACHE_VERSION: int = 3
+    
     def __init__(self):
         self.dong_mapping: Dict[str, DongInfo] = {}
         self.sales_data: Dict[str, SalesData] = {}
         self.store_data: Dict[str, StoreData] = {}
         self.subway_data: Dict[str, bool] = {}
         self.population_data: Dict[str, PopulationData] = {}
+        
+        # 매출 지표 열 배열 캐시 (sales_data가 교체되면 다시 생성)
+        self._sales_source: Optional[Dict[str, SalesData]] = None
+        self._sales_index: Dict[str, int] = {}
+        self._sales_table: Dict[str, np.ndarray] = {}
     
     def get_dong_info(self, dong_code: str) -> Optional[DongInfo]:
         """행정동 정보 조회"""
@@ -1050,6 +1300,71 @@ class DataStore:
         """생활인구 데이터 조회"""
         return self.population_data.get(dong_code)
     
+    def sales_table(self) -> Tuple[Dict[str, int], Dict[str, np.ndarray]]:
+        """매출 데이터를 필드별 배열(Structure of Arrays)로 변환해 캐시"""
+        if self._sales_source is self.sales_data and len(self._sales_index) == len(self.sales_data):
+            return self._sales_index, self._sales_table
+        
+        records = list(self.sales_data.values())
+        
+        def field(name: str) -> np.ndarray:
+            return np.fromiter((getattr(s, name) for s in records), dtype=np.float64, count=len(records))
+        
+        revenue = field('revenue')
+        female, male = field('female_revenue'), field('male_revenue')
+        weekday, weekend = field('weekday_revenue'), field('weekend_revenue')
+        gender_total = female + male
+        weekday_total = weekday + weekend
+        
+        # SalesData 비율 프로퍼티와 같은 기본값 (합계가 0이면 0.5 / 0.7 / 0)
+        table = {
+            'revenue': revenue,
+            'avg_price': field('avg_price'),
+            'has_gender': gender_total > 0,
+            'female_ratio': np.divide(female, gender_total, out=np.full(len(records), 0.5), where=gender_total > 0),
+            'weekday_ratio': np.divide(weekday, weekday_total, out=np.full(len(records), 0.7), where=weekday_total > 0)
+        }
+        for time_slot, field_name in SalesData.TIME_SLOT_FIELDS.items():
+            table[f'{time_slot}_ratio'] = np.divide(
+                field(field_name), revenue, out=np.zeros(len(records)), where=revenue != 0
+            )
+        
+        self._sales_source = self.sales_data
+        self._sales_index = {code: i for i, code in enumerate(self.sales_data)}
+        self._sales_table = table
+        return self._sales_index, self._sales_table
+    
+    def as_columns(self, dong_codes: List[str]) -> Dict[str, np.ndarray]:
+        """후보 행정동의 필터 지표를 열 단위 배열로 변환 (매출 데이터가 없으면 NaN)"""
+        index, table = self.sales_table()
+        rows = np.fromiter((index.get(code, -1) for code in dong_codes), dtype=np.int64, count=len(dong_codes))
+        has_sales = rows >= 0
+        
+        def sales_column(name: str) -> np.ndarray:
+            column = np.full(len(dong_codes), np.nan)
+            column[has_sales] = table[name][rows[has_sales]]
+            return column
+        
+        # 매출 성별 합계가 없는 행정동만 생활인구 기준으로 보완
+        female_ratio = sales_column('female_ratio')
+        has_gender = has_sales.copy()
+        has_gender[has_sales] = table['has_gender'][rows[has_sales]]
+        for i in np.flatnonzero(~has_gender):
+            female_ratio[i] = self.get_female_ratio(dong_codes[i])
+        
+        columns = {
+            'revenue': sales_column('revenue'),
+            'avg_price': sales_column('avg_price'),
+            'weekday_ratio': sales_column('weekday_ratio'),
+            'female_ratio': female_ratio,
+            'store_count': np.array([self.get_store_count(code) for code in dong_codes], dtype=np.int64),
+            'subway': np.array([self.has_subway_access(code) for code in dong_codes], dtype=bool)
+        }
+        for time_slot in SalesData.TIME_SLOT_FIELDS:
+            columns[f'{time_slot}_ratio'] = sales_column(f'{time_slot}_ratio')
+        
+        return columns
+    
     def get_female_ratio(self, dong_code: str) -> float:
         """여성 비율 조회 (매출 우선, 인구 차선)"""
         sales_data = self.get_sales_data(dong_code)
@@ -1375,16 +1690,11 @@ class CafeLocationOptimizer:
             self.logger.warning(f"지하철 데이터 파일이 없습니다: {filepath}")
             return
         
-        # CSV 파일 읽기
-        df = None
-        for encoding in self.config.encodings:
-            try:
-                df = pd.read_csv(filepath, encoding=encoding)
-                self.logger.info(f"지하철 데이터 파일 로드 성공 (encoding: {encoding})")
-                break
-            except Exception as e:
-                self.logger.debug(f"인코딩 실패 {encoding}: {e}")
-                continue
+        # CSV 파일 읽기 (Parquet 캐시 우선)
+        df = read_table(
+            filepath, self.config.encodings, self.config.use_parquet_cache,
+            engine=self.config.csv_engine
+        )
         
         if df is None:
             self.logger.error(f"지하철 데이터 파일 로드 실패: {filepath}")
@@ -1473,12 +1783,14 @@ class CafeLocationOptimizer:
         subway_count = 0
         error_count = 0
         
-        for idx, row in df.iterrows():
+        # 공통 dtype으로 변환해 기존 행 단위 순회와 같은 코드 표기 유지
+        values = df[[dong_col, passenger_col]].to_numpy().tolist()
+        for idx, (dong_value, passenger_value) in zip(df.index, values):
             try:
-                dong_code = str(row[dong_col]).strip()
+                dong_code = str(dong_value).strip()
                 
                 # 행정동 코드 정제
-                if dong_code == 'nan' or dong_code == '' or pd.isna(row[dong_col]):
+                if dong_code == 'nan' or dong_code == '' or pd.isna(dong_value):
                     continue
                 
                 # 숫자만 있는 경우 처리
@@ -1487,7 +1799,7 @@ class CafeLocationOptimizer:
                     if len(dong_code) not in [8, 10]:
                         continue
                 
-                passengers = self._safe_float(row[passenger_col])
+                passengers = self._safe_float(passenger_value)
                 
                 if passengers > 0:
                     # 다양한 형태로 저장
@@ -1518,88 +1830,123 @@ class CafeLocationOptimizer:
             self.logger.warning(f"샘플 데이터:\n{df[[dong_col, passenger_col]].head(10)}")
     
     def _load_population_data(self, file_list: List[str]) -> None:
-        """생활인구 데이터 로드"""
+        """생활인구 데이터 로드 (파일별 행정동 합계를 청크 단위로 누적)"""
         valid_files = [f for f in file_list if os.path.exists(f)]
         if not valid_files:
             self.logger.warning("생활인구 데이터 파일이 없습니다")
             return
         
-        total_loaded = 0
+        file_totals = []
         
         for filepath in valid_files:
-            # CSV 파일 읽기
-            df = None
-            for encoding in self.config.encodings:
-                try:
-                    df = pd.read_csv(filepath, encoding=encoding)
-                    break
-                except Exception:
-                    continue
-            
-            if df is None:
-                self.logger.warning(f"파일 로드 실패: {filepath}")
+            totals = self._aggregate_population_file(filepath)
+            if totals is None:
                 continue
             
-            # 컬럼명 정리
-            df.columns = df.columns.str.strip()
-            
-            # 필요한 컬럼 찾기
-            dong_col = None
-            total_col = None
-            female_cols = []
-            male_cols = []
-            
-            for col in df.columns:
-                if '행정동' in col and '코드' in col:
-                    dong_col = col
-                elif '총생활인구수' in col or '생활인구' in col:
-                    total_col = col
-                elif '여성' in col and any(age in col for age in ['20대', '30대', '40대', '50대']):
-                    female_cols.append(col)
-                elif '남성' in col and any(age in col for age in ['20대', '30대', '40대', '50대']):
-                    male_cols.append(col)
-            
-            if not dong_col:
-                self.logger.warning(f"행정동 코드 컬럼을 찾을 수 없습니다: {filepath}")
-                continue
+            file_totals.append(totals)
+            self.logger.info(f"생활인구 파일 로드: {os.path.basename(filepath)}")
+        
+        total_loaded = len(file_totals)
+        
+        # 평균값으로 변환 (여러 파일의 평균)
+        if total_loaded > 0:
+            averages = pd.concat(file_totals).groupby(level=0, sort=False).sum() / total_loaded
             
-            # 생활인구 데이터 처리
-            for _, row in df.iterrows():
-                dong_code = str(row[dong_col]).strip()
+            for dong_code, total, female, male in averages.itertuples(name=None):
+                self.data_store.population_data[dong_code] = PopulationData(
+                    total_population=total,
+                    female_20_50=female,
+                    male_20_50=male
+                )
+        
+        self.logger.info(f"생활인구 데이터 로드 완료: {len(self.data_store.population_data)}개 행정동 ({total_loaded}개 파일)")
+    
+    def _aggregate_population_file(self, filepath: str) -> Optional[pd.DataFrame]:
+        """생활인구 파일 하나를 청크 단위로 읽어 행정동별 합계 계산"""
+        for encoding in self.config.encodings:
+            try:
+                header = pd.read_csv(filepath, encoding=encoding, nrows=0)
+                columns = self._find_population_columns(list(header.columns.str.strip()))
                 
-                # 기존 데이터가 있으면 누적
-                if dong_code not in self.data_store.population_data:
-                    self.data_store.population_data[dong_code] = PopulationData(
-                        total_population=0,
-                        female_20_50=0,
-                        male_20_50=0
-                    )
+                if columns is None:
+                    self.logger.warning(f"행정동 코드 컬럼을 찾을 수 없습니다: {filepath}")
+                    return None
                 
-                pop_data = self.data_store.population_data[dong_code]
+                needed = {col for col in columns if isinstance(col, str)}
+                needed.update(columns[2] + columns[3])
+                usecols = [col for col in header.columns if col.strip() in needed]
                 
-                # 총 생활인구
-                if total_col:
-                    pop_data.total_population += self._safe_float(row.get(total_col, 0))
+                # pyarrow 엔진은 청크 읽기를 지원하지 않아 필요한 컬럼만 한 번에 읽음
+                if resolve_csv_engine(self.config.csv_engine) == 'pyarrow':
+                    chunks = [pd.read_csv(filepath, encoding=encoding, usecols=usecols, engine='pyarrow')]
+                else:
+                    chunks = pd.read_csv(
+                        filepath,
+                        encoding=encoding,
+                        usecols=usecols,
+                        chunksize=self.config.csv_chunksize
+                    )
                 
-                # 20-50대 여성
-                for col in female_cols:
-                    pop_data.female_20_50 += self._safe_float(row.get(col, 0))
+                chunk_totals = []
+                for chunk in chunks:
+                    chunk.columns = chunk.columns.str.strip()
+                    chunk_totals.append(self._sum_population_chunk(chunk, *columns))
                 
-                # 20-50대 남성
-                for col in male_cols:
-                    pop_data.male_20_50 += self._safe_float(row.get(col, 0))
-            
-            total_loaded += 1
-            self.logger.info(f"생활인구 파일 로드: {os.path.basename(filepath)}")
+                return pd.concat(chunk_totals).groupby(level=0, sort=False).sum()
+            except Exception:
+                continue
         
-        # 평균값으로 변환 (여러 파일의 평균)
-        if total_loaded > 0:
-            for dong_code, pop_data in self.data_store.population_data.items():
-                pop_data.total_population /= total_loaded
-                pop_data.female_20_50 /= total_loaded
-                pop_data.male_20_50 /= total_loaded
+        self.logger.warning(f"파일 로드 실패: {filepath}")
+        return None
+    
+    def _find_population_columns(
+        self,
+        columns: List[str]
+    ) -> Optional[Tuple[str, Optional[str], List[str], List[str]]]:
+        """생활인구 파일의 (행정동 코드, 총생활인구, 20-50대 여성, 20-50대 남성) 컬럼 찾기"""
+        dong_col = None
+        total_col = None
+        female_cols = []
+        male_cols = []
         
-        self.logger.info(f"생활인구 데이터 로드 완료: {len(self.data_store.population_data)}개 행정동 ({total_loaded}개 파일)")
+        for col in columns:
+            if '행정동' in col and '코드' in col:
+                dong_col = col
+            elif '총생활인구수' in col or '생활인구' in col:
+                total_col = col
+            elif '여성' in col and any(age in col for age in ['20대', '30대', '40대', '50대']):
+                female_cols.append(col)
+            elif '남성' in col and any(age in col for age in ['20대', '30대', '40대', '50대']):
+                male_cols.append(col)
+        
+        if not dong_col:
+            return None
+        
+        return dong_col, total_col, female_cols, male_cols
+    
+    def _sum_population_chunk(
+        self,
+        chunk: pd.DataFrame,
+        dong_col: str,
+        total_col: Optional[str],
+        female_cols: List[str],
+        male_cols: List[str]
+    ) -> pd.DataFrame:
+        """청크 내 행정동별 (총생활인구, 20-50대 여성, 20-50대 남성) 합계"""
+        def row_sum(cols: List[str]) -> pd.Series:
+            if not cols:
+                return pd.Series(0.0, index=chunk.index)
+            values = chunk[cols].apply(pd.to_numeric, errors='coerce').fillna(0)
+            return values.sum(axis=1).astype(float)
+        
+        sums = pd.DataFrame({
+            'total': row_sum([total_col] if total_col else []),
+            'female': row_sum(female_cols),
+            'male': row_sum(male_cols)
+        })
+        sums.index = chunk[dong_col].astype(str).str.strip()
+        
+        return sums.groupby(level=0, sort=False).sum()
     
     def _load_od_data(self, folder_list: List[str]) -> None:
         """OD 데이터 로드 및 네트워크 구축"""
@@ -1624,6 +1971,14 @@ class CafeLocationOptimizer:
         top_n: int = 5
     ) -> List[RecommendationResult]:
         """최적 입지 추천"""
+        return list(self.iter_recommendations(preferences, top_n))
+    
+    def iter_recommendations(
+        self,
+        preferences: Optional[UserPreferences] = None,
+        top_n: int = 5
+    ) -> Iterator[RecommendationResult]:
+        """최적 입지 추천 (순위 순서대로 하나씩 생성)"""
         if preferences is None:
             preferences = UserPreferences()
         
@@ -1633,7 +1988,7 @@ class CafeLocationOptimizer:
         all_objectives = self._calculate_all_objectives()
         if not all_objectives:
             self.logger.warning("분석 가능한 데이터가 없습니다")
-            return []
+            return
         
         # 2. 정규화
         normalized = self.objective_calculator.normalize(all_objectives)
@@ -1665,7 +2020,7 @@ class CafeLocationOptimizer:
         )
         
         # 6. 추천 결과 생성
-        return self._create_recommendations(scored_candidates[:top_n])
+        yield from self._iter_recommendations(scored_candidates[:top_n])
     
     def _calculate_all_objectives(self) -> Dict[str, Dict[str, float]]:
         """모든 행정동의 목적함수 계산"""
@@ -1700,18 +2055,22 @@ class CafeLocationOptimizer:
         preferences: UserPreferences
     ) -> List[Tuple[str, float]]:
         """최종 점수 계산"""
-        scores = []
         weights = self._adjust_weights_by_preferences(preferences)
         
-        for dong in candidates:
-            score = sum(
-                normalized.get(dong, {}).get(obj, 0) * weight
-                for obj, weight in weights.items()
-            )
-            scores.append((dong, score))
+        # 후보 × 목적함수 행렬 (없는 값은 0)
+        matrix = np.array([
+            [normalized.get(dong, {}).get(obj, 0) for obj in weights]
+            for dong in candidates
+        ], dtype=np.float64).reshape(len(candidates), len(weights))
+        
+        # 가중합 (목적함수 순서대로 누적해 기존 합계와 동일한 결과)
+        scores = np.zeros(len(candidates))
+        for j, weight in enumerate(weights.values()):
+            scores += matrix[:, j] * weight
         
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores
+        # 점수 내림차순 (동점은 기존 순서 유지)
+        order = np.argsort(-scores, kind='stable')
+        return [(candidates[i], score) for i, score in zip(order.tolist(), scores[order].tolist())]
     
     def _adjust_weights_by_preferences(
         self,
@@ -1746,8 +2105,13 @@ class CafeLocationOptimizer:
         scored_candidates: List[Tuple[str, float]]
     ) -> List[RecommendationResult]:
         """추천 결과 생성"""
-        recommendations = []
-        
+        return list(self._iter_recommendations(scored_candidates))
+    
+    def _iter_recommendations(
+        self,
+        scored_candidates: List[Tuple[str, float]]
+    ) -> Iterator[RecommendationResult]:
+        """추천 결과를 하나씩 생성"""
         for dong_code, score in scored_candidates:
             # 데이터 수집
             dong_info = self.data_store.get_dong_info(dong_code)
@@ -1782,9 +2146,7 @@ class CafeLocationOptimizer:
                 inflow_population=self.network_analyzer.calculate_inflow(dong_code)
             )
             
-            recommendations.append(recommendation)
-        
-        return recommendations
+            yield recommendation
     
     def print_detailed_analysis(self, dong_code: str) -> None:
         """특정 행정동 상세 분석 출력"""